@@ -168,27 +168,23 @@ def _compute_bar_stats(
     if not scen_present or not ctrl_present:
         raise RuntimeError("No matching scenarios/controllers found in the dataset.")
 
+    # One grouped pass for all cells, reindexed onto the [S, C] grid
+    # (missing combinations become n=0 rows).
     S, C = len(scen_present), len(ctrl_present)
-    means = np.zeros((S, C), dtype=np.float64)
-    ci_half = np.zeros((S, C), dtype=np.float64)
-
-    for i, scen in enumerate(scen_present):
-        g_scen = per_run[per_run["scenario"] == scen]
-        for j, ctrl in enumerate(ctrl_present):
-            x = g_scen.loc[
-                g_scen["controller"] == ctrl, "total_CO2_kg_per_run"
-            ].dropna()
-            n = int(x.shape[0])
-            mean_val = float(x.mean()) if n > 0 else 0.0
-            if n <= 1:
-                ci = 0.0
-            else:
-                sem = float(x.sem())
-                tcrit = float(t.ppf(0.5 * (1 + CONFIDENCE), df=n - 1))
-                ci = sem * tcrit
-
-            means[i, j] = mean_val
-            ci_half[i, j] = ci
+    grid = pd.MultiIndex.from_product([scen_present, ctrl_present], names=["scenario", "controller"])
+    agg = (
+        per_run.groupby(["scenario", "controller"])["total_CO2_kg_per_run"]
+        .agg(["mean", "sem", "count"])
+        .reindex(grid)
+    )
+
+    n = agg["count"].fillna(0).to_numpy(dtype=np.int_).reshape(S, C)
+    means = np.nan_to_num(agg["mean"].to_numpy(dtype=np.float64), nan=0.0).reshape(S, C)
+
+    # Student t half-width; CI is 0 when n <= 1
+    tcrit = t.ppf(0.5 * (1 + CONFIDENCE), df=np.maximum(n - 1, 1))
+    ci_half = np.where(n > 1, agg["sem"].to_numpy(dtype=np.float64).reshape(S, C) * tcrit, 0.0)
+    ci_half = np.nan_to_num(ci_half, nan=0.0)
 
     return means, ci_half, scen_present, ctrl_present
 
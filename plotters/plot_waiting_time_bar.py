@@ -125,9 +125,9 @@ def read_tripinfo() -> pd.DataFrame:
     df["run"] = df["run"].astype(str)
     df["waitingTime"] = pd.to_numeric(df["waitingTime"], errors="coerce")
 
-    # Keep finite, non-negative waiting times
-    df = df[np.isfinite(df["waitingTime"])]
-    df = df[df["waitingTime"] >= 0]
+    # Keep finite, non-negative waiting times (single mask → single copy)
+    wt = df["waitingTime"].to_numpy()
+    df = df[np.isfinite(wt) & (wt >= 0)]
 
     if df.empty:
         raise ValueError("tripinfo is empty after cleaning required columns.")
@@ -137,23 +137,6 @@ def read_tripinfo() -> pd.DataFrame:
 # ─────────────────────────────────────────────────────────────────────────────
 # Stats computation
 # ─────────────────────────────────────────────────────────────────────────────
-def _mean_ci_from_per_run(
-    vals: pd.Series, confidence: float = CONFIDENCE
-) -> Tuple[float, float, int]:
-    """Compute (mean, CI half-width, n) for a vector of per-run means.
-
-    If n <= 1, CI half-width is 0.
-    """
-    x = vals.dropna()
-    n = int(x.shape[0])
-    mean = float(x.mean()) if n > 0 else float("nan")
-    if n <= 1:
-        return mean, 0.0, n
-    sem = float(x.sem())
-    tcrit = float(t.ppf(0.5 * (1 + confidence), df=n - 1))
-    return mean, sem * tcrit, n
-
-
 def compute_waiting_time_stats(
     df: pd.DataFrame,
     scenarios: Sequence[str],
@@ -173,19 +156,23 @@ def compute_waiting_time_stats(
         .rename(columns={"waitingTime": "waitingTime_mean_per_run"})
     )
 
+    # One grouped pass for all cells, reindexed onto the requested [S, C] grid
+    # (missing combinations become n=0 rows).
     S, C = len(scenarios), len(controllers)
-    means = np.zeros((S, C), dtype=np.float64)
-    cis = np.zeros((S, C), dtype=np.float64)
-    ns = np.zeros((S, C), dtype=np.int_)
-
-    for i, scen in enumerate(scenarios):
-        g_scen = per_run[per_run["scenario"] == scen]
-        for j, ctrl in enumerate(controllers):
-            g = g_scen[g_scen["controller"] == ctrl]
-            m, ci, n = _mean_ci_from_per_run(g["waitingTime_mean_per_run"])
-            means[i, j] = 0.0 if not np.isfinite(m) else m
-            cis[i, j] = 0.0 if not np.isfinite(ci) else ci
-            ns[i, j] = n
+    grid = pd.MultiIndex.from_product([scenarios, controllers], names=["scenario", "controller"])
+    agg = (
+        per_run.groupby(["scenario", "controller"])["waitingTime_mean_per_run"]
+        .agg(["mean", "sem", "count"])
+        .reindex(grid)
+    )
+
+    ns = agg["count"].fillna(0).to_numpy(dtype=np.int_).reshape(S, C)
+    means = np.nan_to_num(agg["mean"].to_numpy(dtype=np.float64), nan=0.0).reshape(S, C)
+
+    # Student t half-width; CI is 0 when n <= 1
+    tcrit = t.ppf(0.5 * (1 + CONFIDENCE), df=np.maximum(ns - 1, 1))
+    cis = np.where(ns > 1, agg["sem"].to_numpy(dtype=np.float64).reshape(S, C) * tcrit, 0.0)
+    cis = np.nan_to_num(cis, nan=0.0)
 
     return means, cis, ns
 
@@ -5,28 +5,37 @@ scripts/sweep_experiments.py
 
 Run all experiments used in the paper: 3 controllers × 5 scenarios × 10 seeds = 150 runs.
 
-This script executes the experiment runner module repeatedly, one run per
-(controller, scenario, seed) triple, relying on **pre-generated routes**
-(e.g., `generated_routes_<scenario>.rou.xml`) and the specified network file.
+This script calls the experiment runner (`fuzzylts.pipelines.run_experiment.run`)
+in-process, one run per (controller, scenario, seed) triple, relying on
+**pre-generated routes** (e.g., `generated_routes_<scenario>.rou.xml`) and the
+specified network file.
 
 Usage
 -----
-    python scripts/sweep_experiments.py
+    python scripts/sweep_experiments.py [--jobs N]
 
 Notes
 -----
 - The network file path is taken from the `NET` constant below.
-- This script is intentionally sequential to preserve the original workflow.
-- Any failure in a run will raise an exception and stop subsequent runs.
+- Runs are independent, so they are dispatched to a process pool
+  (`--jobs`, default: half the CPU count). SUMO is single-threaded, so
+  throughput scales roughly linearly until cores run out.
+- `--jobs 1` keeps the original sequential workflow (grid order preserved).
+- Runs execute in-process (no per-run interpreter start-up); each pool worker
+  pays the import cost (numpy, pandas, traci, controllers) only once.
+- Any failure in a run will raise an exception and cancel pending runs.
 """
 
 from __future__ import annotations
 
+import argparse
 import logging
-import subprocess
-import sys
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from itertools import product
-from typing import List
+from typing import Dict, List, Tuple
+
+from fuzzylts.pipelines.run_experiment import run
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration
@@ -40,13 +49,29 @@ SEEDS: List[int] = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 # Network file (assumed to be accessible from the 'sumo_files' directory)
 NET: str = "cuenca.net.xml.gz"
 
-# Entry point module
-RUNNER_MODULE: str = "fuzzylts.pipelines.run_experiment"
+# Default parallelism: leave headroom for SUMO and the OS
+DEFAULT_JOBS: int = max(1, (os.cpu_count() or 2) // 2)
 
 # Logging
 LOGGER = logging.getLogger(__name__)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────────────────────
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Run the full experiment grid.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of runs executed in parallel (default: {DEFAULT_JOBS}).",
+    )
+    return parser.parse_args()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Execution
 # ─────────────────────────────────────────────────────────────────────────────
@@ -59,35 +84,44 @@ def run_one(ctrl: str, scn: str, seed: int) -> None:
         seed: Integer seed (1..10 in the paper).
 
     Raises:
-        subprocess.CalledProcessError: If the underlying runner exits non-zero.
+        Exception: Whatever the underlying runner raises (missing inputs, SUMO errors, ...).
     """
-    cmd = [
-        sys.executable,
-        "-m",
-        RUNNER_MODULE,
-        "--controller",
-        ctrl,
-        "--scenario",
-        scn,
-        "--seed",
-        str(seed),
-        "--net-file",
-        NET,
-    ]
     LOGGER.info("Running: controller=%s | scenario=%s | seed=%s", ctrl, scn, seed)
-    subprocess.check_call(cmd)
+    run(controller=ctrl, scenario=scn, seed=seed, net_file=NET)
 
 
 def main() -> None:
     """Execute the full grid of (controller, scenario, seed)."""
+    args = parse_args()
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
 
-    total = len(CONTROLLERS) * len(SCENARIOS) * len(SEEDS)
-    LOGGER.info("Starting full sweep: %d runs (3x5x10)", total)
-
-    for ctrl, scn, seed in product(CONTROLLERS, SCENARIOS, SEEDS):
-        print(f"\n====> Running | controller={ctrl} | scenario={scn} | seed={seed}\n")
-        run_one(ctrl, scn, seed)
+    grid: List[Tuple[str, str, int]] = list(product(CONTROLLERS, SCENARIOS, SEEDS))
+    jobs = max(1, min(args.jobs, len(grid)))
+    LOGGER.info("Starting full sweep: %d runs (3x5x10) with %d job(s)", len(grid), jobs)
+
+    if jobs == 1:
+        for ctrl, scn, seed in grid:
+            print(f"\n====> Running | controller={ctrl} | scenario={scn} | seed={seed}\n")
+            run_one(ctrl, scn, seed)
+        LOGGER.info("All runs completed successfully.")
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        futures: Dict[Future[None], Tuple[str, str, int]] = {
+            ex.submit(run_one, *task): task for task in grid
+        }
+        for done, fut in enumerate(as_completed(futures), start=1):
+            ctrl, scn, seed = futures[fut]
+            try:
+                fut.result()
+            except Exception:
+                LOGGER.error("Run failed: controller=%s | scenario=%s | seed=%s", ctrl, scn, seed)
+                ex.shutdown(wait=True, cancel_futures=True)
+                raise
+            LOGGER.info(
+                "[%d/%d] Finished: controller=%s | scenario=%s | seed=%s",
+                done, len(grid), ctrl, scn, seed,
+            )
 
     LOGGER.info("All runs completed successfully.")
 
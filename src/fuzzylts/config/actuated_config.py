@@ -20,11 +20,16 @@ Notes
 -----
 - All durations are in **seconds**.
 - `phase_lanes` maps: TLS_ID → { phase_index → [lane_id, ...] }.
+- `load()` is memoized per process on the resolved network path and the
+  modification times of both the network and the YAML file; callers receive
+  an independent deep copy.
 """
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar, Dict, List, Literal
 
@@ -32,6 +37,12 @@ import yaml
 
 from fuzzylts.utils.extract_phase_lanes import extract_phase_lanes
 
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 # Type aliases for clarity
 PhaseIndex = int
@@ -85,14 +96,28 @@ class ActuatedConfig:
             An initialized `ActuatedConfig` instance.
 
         Raises:
-            FileNotFoundError: If the YAML config file is missing.
+            FileNotFoundError: If the YAML config file or the network is missing.
             KeyError/ValueError: If required YAML keys are missing or invalid.
         """
         if not cls.config_path.exists():
             raise FileNotFoundError(f"Actuated config not found: {cls.config_path}")
 
+        # Key the cache on file identity + mtime so edits invalidate it.
+        net = Path(net_path).resolve()
+        cached = _load_cached(
+            cls,
+            str(net),
+            net.stat().st_mtime_ns,
+            cls.config_path.stat().st_mtime_ns,
+        )
+        # Hand out a private copy; the cached instance must never be mutated.
+        return copy.deepcopy(cached)
+
+    @classmethod
+    def _parse(cls, net_path: Path) -> "ActuatedConfig":
+        """Uncached body of `load()`: parse the YAML and extract the topology."""
         # Load timing tunables from YAML (expects keys defined below).
-        raw = yaml.safe_load(cls.config_path.read_text(encoding="utf-8"))
+        raw = yaml.load(cls.config_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
         if not isinstance(raw, dict):
             raise ValueError(f"Invalid YAML structure in {cls.config_path}; expected a mapping.")
 
@@ -119,3 +144,14 @@ class ActuatedConfig:
             green_duration=float(raw["green_duration"]),
             yellow_fix=float(raw["yellow_fix"]),
         )
+
+
+@lru_cache(maxsize=None)
+def _load_cached(
+    cls: type[ActuatedConfig],
+    net_path: str,
+    net_mtime_ns: int,
+    cfg_mtime_ns: int,
+) -> ActuatedConfig:
+    """Memoized `ActuatedConfig._parse`; mtimes only participate in the cache key."""
+    return cls._parse(Path(net_path))
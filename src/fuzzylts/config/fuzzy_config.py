@@ -23,11 +23,18 @@ Notes
 - `functions` contains the fuzzy variable definitions (arrival, vehicles, green, ...).
 - `rules` encodes the rule base as triplets: [vehicles_level, arrival_level, green_level].
 - `phase_lanes` maps: TLS_ID → { phase_index → [lane_id, ...] }.
+- `load()` is memoized per process on the resolved network path and the
+  modification times of both the network and the YAML file; callers receive
+  an independent deep copy (e.g., the rule tuner hot-swaps `rules`).
+- `override(green_lmin=..., green_lmax=...)` derives a config with other
+  `green` bounds without touching the YAML (used for per-run overrides).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar, Dict, List, Literal
 
@@ -35,6 +42,12 @@ import yaml
 
 from fuzzylts.utils.extract_phase_lanes import extract_phase_lanes
 
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # Type aliases for clarity
 PhaseIndex = int
 LaneId = str
@@ -97,14 +110,28 @@ class FuzzyConfig:
             An initialized `FuzzyConfig` instance.
 
         Raises:
-            FileNotFoundError: If the YAML config file is missing.
+            FileNotFoundError: If the YAML config file or the network is missing.
             KeyError/ValueError: If required YAML keys are missing or invalid.
         """
         if not cls.config_path.exists():
             raise FileNotFoundError(f"Fuzzy config not found: {cls.config_path}")
 
+        # Key the cache on file identity + mtime so edits invalidate it.
+        net = Path(net_path).resolve()
+        cached = _load_cached(
+            cls,
+            str(net),
+            net.stat().st_mtime_ns,
+            cls.config_path.stat().st_mtime_ns,
+        )
+        # Hand out a private copy; the cached instance must never be mutated.
+        return copy.deepcopy(cached)
+
+    @classmethod
+    def _parse(cls, net_path: Path) -> "FuzzyConfig":
+        """Uncached body of `load()`: parse the YAML and extract the topology."""
         # Load fuzzy KB (functions + rules)
-        raw = yaml.safe_load(cls.config_path.read_text(encoding="utf-8"))
+        raw = yaml.load(cls.config_path.read_text(encoding="utf-8"), Loader=_YamlLoader)
         if not isinstance(raw, dict):
             raise ValueError(f"Invalid YAML structure in {cls.config_path}; expected a mapping at the top level.")
 
@@ -149,3 +176,41 @@ class FuzzyConfig:
             functions=funcs,
             rules=rules,
         )
+
+    # --------------------------------------------------------------------- #
+    # Derived configs
+    # --------------------------------------------------------------------- #
+    def override(
+        self,
+        *,
+        green_lmin: float | None = None,
+        green_lmax: float | None = None,
+    ) -> "FuzzyConfig":
+        """Return a copy with the `green` universe bounds replaced.
+
+        `None` keeps the current bound. The topology (`tls`, `phase_lanes`) is
+        shared with `self`; functions and rules are copied.
+
+        Raises:
+            ValueError: If the resulting bounds are not `lmin < lmax`.
+        """
+        green = self.functions["green"]
+        lmin = green.lmin if green_lmin is None else float(green_lmin)
+        lmax = green.lmax if green_lmax is None else float(green_lmax)
+        if not lmin < lmax:
+            raise ValueError(f"Invalid green bounds: lmin={lmin}, lmax={lmax}.")
+
+        functions = dict(self.functions)
+        functions["green"] = FunctionDef(lmin=lmin, lmax=lmax, levels=list(green.levels))
+        return replace(self, functions=functions, rules=[list(r) for r in self.rules])
+
+
+@lru_cache(maxsize=None)
+def _load_cached(
+    cls: type[FuzzyConfig],
+    net_path: str,
+    net_mtime_ns: int,
+    cfg_mtime_ns: int,
+) -> FuzzyConfig:
+    """Memoized `FuzzyConfig._parse`; mtimes only participate in the cache key."""
+    return cls._parse(Path(net_path))
@@ -20,18 +20,28 @@ Notes
 -----
 - All durations are expressed in **seconds** (integers for this controller).
 - `phase_lanes` maps: TLS_ID → { phase_index → [lane_id, ...] }.
+- The parsed YAML mapping is memoized per process on `(path, mtime_ns)`;
+  `load()` works on a deep copy so the cached mapping is never mutated.
 """
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import ClassVar, Dict, List, Literal
+from typing import Any, ClassVar, Dict, List, Literal
 
 import yaml
 
 from fuzzylts.utils.extract_phase_lanes import extract_phase_lanes
 
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # Type aliases for clarity
 PhaseIndex = int
 LaneId = str
@@ -87,7 +97,7 @@ class StaticConfig:
             raise FileNotFoundError(f"Static config not found: {cls.config_path}")
 
         # Load timing tunables from YAML (expects keys defined below).
-        raw = yaml.safe_load(cls.config_path.read_text(encoding="utf-8"))
+        raw = copy.deepcopy(_read_yaml(str(cls.config_path), cls.config_path.stat().st_mtime_ns))
         if not isinstance(raw, dict):
             raise ValueError(f"Invalid YAML structure in {cls.config_path}; expected a mapping.")
 
@@ -112,3 +122,9 @@ class StaticConfig:
             green_fix=int(raw["green_fix"]),
             yellow_fix=int(raw["yellow_fix"]),
         )
+
+
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int) -> Any:
+    """Memoized YAML parse; `mtime_ns` only participates in the cache key."""
+    return yaml.load(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader)
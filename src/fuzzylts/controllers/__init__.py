@@ -15,12 +15,16 @@ Design
 ------
 - Avoid importing all controllers up-front; only the requested one is imported.
 - Cache imported modules for subsequent calls.
+- Submodules are also reachable as attributes (`fuzzylts.controllers.fuzzy`)
+  via a module-level `__getattr__` (PEP 562), importing on first access.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import import_module
-from typing import Callable, Dict, Protocol
+from types import MappingProxyType
+from typing import Callable, Mapping, Protocol
 
 
 class ControllerModule(Protocol):
@@ -39,22 +43,23 @@ class ControllerModule(Protocol):
         ...
 
 
-# Map controller names to their module paths
-_CONTROLLER_MODULES: Dict[str, str] = {
-    "static": "fuzzylts.controllers.static",
-    "actuated": "fuzzylts.controllers.actuated",
-    "fuzzy": "fuzzylts.controllers.fuzzy",
-    "gap_fuzzy": "fuzzylts.controllers.gap_fuzzy",
-}
-
-# Cache for imported controller modules
-_controller_cache: Dict[str, ControllerModule] = {}
+# Map controller names to their module paths (read-only)
+_CONTROLLER_MODULES: Mapping[str, str] = MappingProxyType(
+    {
+        "static": "fuzzylts.controllers.static",
+        "actuated": "fuzzylts.controllers.actuated",
+        "fuzzy": "fuzzylts.controllers.fuzzy",
+        "gap_fuzzy": "fuzzylts.controllers.gap_fuzzy",
+    }
+)
 
 
+@lru_cache(maxsize=None)
 def get_controller(name: str) -> ControllerModule:
     """Retrieve the controller module for the specified `name`.
 
-    This function imports the module on first use and caches it for subsequent calls.
+    This function imports the module on first use; `lru_cache` memoizes the
+    result for subsequent calls (unknown names raise and are not cached).
 
     Args:
         name: Controller identifier (e.g., "static", "actuated", "fuzzy", "gap_fuzzy").
@@ -65,18 +70,20 @@ def get_controller(name: str) -> ControllerModule:
     Raises:
         ValueError: If `name` is not a recognized controller.
     """
-    if name in _controller_cache:
-        return _controller_cache[name]
-
     try:
         module_path = _CONTROLLER_MODULES[name]
     except KeyError as exc:
         valid = ", ".join(sorted(_CONTROLLER_MODULES.keys()))
         raise ValueError(f"Unknown controller '{name}'. Valid options are: {valid}") from exc
 
-    module = import_module(module_path)  # type: ignore[assignment]
-    _controller_cache[name] = module  # type: ignore[assignment]
-    return module
+    return import_module(module_path)  # type: ignore[return-value]
+
+
+def __getattr__(name: str) -> ControllerModule:
+    """Lazily resolve controller submodules accessed as package attributes."""
+    if name in _CONTROLLER_MODULES:
+        return get_controller(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["get_controller", "ControllerModule"]
@@ -16,23 +16,25 @@ Intended for reproducible experiments in scientific codebases.
 
 from __future__ import annotations
 
+import logging
 import os
-import subprocess
+from collections import deque
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from shutil import which
 from typing import List, Optional
 
-import traci
 import traci.constants as tc
-from traci import trafficlight as tl
 
 # NOTE: keep the import path as in the original codebase.
 # If your repo defines this in utils instead of config, adjust there (not here).
 from fuzzylts.config.actuated_config import ActuatedConfig  # type: ignore
 from fuzzylts.utils.log import get_logger  # type: ignore
+from fuzzylts.utils.traci_backend import traci
 
 LOGGER = get_logger(__name__)
+tl = traci.trafficlight  # resolved against the selected backend (traci or libsumo)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
@@ -41,6 +43,10 @@ LOGGER = get_logger(__name__)
 ACTUATED_TYPE: int = tc.TRAFFICLIGHT_TYPE_ACTUATED  # TraCI constant
 NET_ENV_VAR: str = "TARGET_NET_XML"                 # input .net.xml from env
 
+# Extra TLS variables the runner adds to its per-step TLS subscription
+# (SUMO keeps one variable list per object, so the runner owns it).
+TLS_SUBSCRIPTION_VARS: tuple[int, ...] = (tc.TL_PHASE_DURATION,)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration (path injected via env for reproducibility)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -54,8 +60,12 @@ cfg = ActuatedConfig.load(net_path=_net_path_env)  # type: ignore[arg-type]
 # Phase transformation helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=None)
 def _phase_is_yellow(state: str) -> bool:
-    """Heuristic: treat any 'y' in the state string as a yellow/transition phase."""
+    """Heuristic: treat any 'y' in the state string as a yellow/transition phase.
+
+    Memoized: networks reuse a handful of state strings across hundreds of TLS.
+    """
     return "y" in state
 
 
@@ -81,27 +91,22 @@ def _make_actuated_phases(
     Returns:
         A list of `tl.Phase` configured as actuated (min/max/next).
     """
-    out: List[tl.Phase] = []
     n = len(phases_in)
-    for i, p in enumerate(phases_in):
-        if _phase_is_yellow(p.state):
-            duration = minDur = maxDur = float(yellow_fix)
-        else:
-            duration = float(green_duration)
-            minDur = float(green_min)
-            maxDur = float(green_max)
-
-        next_tuple = ((i + 1) % n,)  # ring next
-        out.append(
-            tl.Phase(
-                duration=duration,
-                state=p.state,
-                minDur=minDur,
-                maxDur=maxDur,
-                next=next_tuple,
-            )
+    # (duration, minDur, maxDur) per phase class, resolved once per call.
+    green = (float(green_duration), float(green_min), float(green_max))
+    yellow = (float(yellow_fix),) * 3
+    timings = [yellow if _phase_is_yellow(p.state) else green for p in phases_in]
+
+    return [
+        tl.Phase(
+            duration=duration,
+            state=p.state,
+            minDur=minDur,
+            maxDur=maxDur,
+            next=((i + 1) % n,),  # ring next
         )
-    return out
+        for i, (p, (duration, minDur, maxDur)) in enumerate(zip(phases_in, timings))
+    ]
 
 
 def build_actuated_logic_from(
@@ -160,7 +165,7 @@ def initialize_tls() -> None:
     for tls_id in cfg.tls:
         current_prog = tl.getProgram(tls_id)
         logics = tl.getAllProgramLogics(tls_id)
-        base = next((L for L in logics if getattr(L, "programID", None) == current_prog), logics[0])
+        base = {L.programID: L for L in logics}.get(current_prog, logics[0])
 
         new_logic = build_actuated_logic_from(
             base,
@@ -180,14 +185,25 @@ def initialize_tls() -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def get_phase_duration(tls_id: str) -> float:
-    """Return the configured duration (seconds) of the current phase for `tls_id`."""
-    return float(tl.getPhaseDuration(tls_id))
+    """Return the configured duration (seconds) of the current phase for `tls_id`.
+
+    Served from the runner's TLS subscription (see `TLS_SUBSCRIPTION_VARS`);
+    falls back to a direct query when no subscription is active.
+    """
+    res = tl.getSubscriptionResults(tls_id)
+    if not res or tc.TL_PHASE_DURATION not in res:
+        return float(tl.getPhaseDuration(tls_id))
+    return float(res[tc.TL_PHASE_DURATION])
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Network preprocessing (netconvert)
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Lines of netconvert output kept for the error message on failure
+_NETCONVERT_TAIL_LINES = 200
+
+
 class NetworkBuildError(RuntimeError):
     """Raised when `netconvert` fails to rebuild the network."""
 
@@ -235,7 +251,12 @@ def preprocess_network(path: Path, *, out_name: str | None = None, force: bool =
         LOGGER.info("Using existing network: %s", output)
         return output
 
+    import subprocess  # deferred: only needed when the network must be rebuilt
+
     netconvert = _resolve_netconvert()
+    # Write to a per-process temp file and rename atomically, so concurrent
+    # runs (parallel sweeps) never observe a partially written network.
+    tmp_output = output.with_name(f"{output.stem}.{os.getpid()}.tmp{output.suffix}")
     cmd = [
         netconvert,
         "-s",
@@ -245,23 +266,35 @@ def preprocess_network(path: Path, *, out_name: str | None = None, force: bool =
         "--tls.default-type",
         "actuated",
         "-o",
-        str(output),
+        str(tmp_output),
     ]
 
     LOGGER.info("Running netconvert to rebuild TLS as actuated.")
     LOGGER.debug("Command: %s", " ".join(cmd))
 
-    try:
-        proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        if proc.stdout:
-            LOGGER.debug("netconvert stdout:\n%s", proc.stdout)
-        if proc.stderr:
-            # netconvert is chatty on stderr even on success; keep as debug
-            LOGGER.debug("netconvert stderr:\n%s", proc.stderr)
-    except subprocess.CalledProcessError as e:
-        msg = f"netconvert failed (code {e.returncode}). Stderr:\n{e.stderr}"
+    # Stream netconvert's output instead of buffering all of it (stderr is
+    # very verbose on large maps): only a bounded tail is kept for the error
+    # message, and at DEBUG each line is logged as it arrives.
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
+    tail: deque[str] = deque(maxlen=_NETCONVERT_TAIL_LINES)
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE if debug else subprocess.DEVNULL,
+        stderr=subprocess.STDOUT if debug else subprocess.PIPE,
+        text=True,
+    ) as proc:
+        for line in proc.stdout if debug else proc.stderr:  # type: ignore[union-attr]
+            tail.append(line)
+            if debug:
+                LOGGER.debug("netconvert: %s", line.rstrip())
+
+    if proc.returncode != 0:
+        tmp_output.unlink(missing_ok=True)
+        msg = f"netconvert failed (code {proc.returncode}). Stderr (last {len(tail)} lines):\n{''.join(tail)}"
         LOGGER.error(msg)
-        raise NetworkBuildError(msg) from e
+        raise NetworkBuildError(msg)
+
+    os.replace(tmp_output, output)
 
     LOGGER.info("Wrote actuated network: %s", output)
     return output
@@ -4,13 +4,20 @@
 """
 Fuzzy TLS Controller utilities for SUMO/TraCI.
 
-Builds a scikit-fuzzy control system once and exposes a minimal controller API:
+Evaluates the fuzzy system once over its whole input grid and exposes a
+minimal controller API:
 
 - `get_phase_duration(tls_id)`:
     Returns the suggested green time (seconds) when the TLS is in a **green** phase.
     (By convention, green phases are those whose state string contains 'g' or 'G'.)
-- `initialize_tls()`:
-    No-op (provided for interface compatibility with other controllers).
+- `initialize_tls(green_lmin=None, green_lmax=None)`:
+    Clears per-run state (arrival-rate history) so consecutive runs in one
+    process start from scratch, sets the run's `green` bounds (the configured
+    ones when not given), and subscribes every mapped lane's vehicle count
+    (one bulk read per step instead of one round-trip per lane).
+- `set_rules(rules)`:
+    Swaps the rule base at runtime (rebuilds the lookup table); used by the
+    rule tuner.
 - `preprocess_network(path)`:
     Delegates to the static controller's network preprocessor (no-op for topology).
 
@@ -27,24 +34,28 @@ Notes
 - Green phases are detected when the phase state string contains `'g'` or `'G'`.
 - This module assumes the **network → lanes per phase** mapping is available
   via the fuzzy configuration (derived from the SUMO network).
+- Green times are served from a (vehicles × arrival-rate) lookup table built
+  at import by `green_surface` (a vectorized equivalent of scikit-fuzzy's
+  Mamdani inference); the rate is quantized to `RATE_BINS` points over the
+  `arrival` universe.
 """
 
 from __future__ import annotations
 
 import os
-from math import isfinite
+import sys
+from math import ceil
 from pathlib import Path
-from typing import Final, Dict, Tuple
+from typing import Any, Final, Dict, Mapping, Sequence, Tuple
 
 import numpy as np
-import traci
-from skfuzzy import control as ctrl
+import traci.constants as tc
 
 # Keep imports consistent with the existing codebase layout.
 from fuzzylts.config.fuzzy_config import FuzzyConfig  # type: ignore
-from fuzzylts.utils.fuzzy_system import generate_memberships, build_rules  # type: ignore
-from fuzzylts.controllers import static  # type: ignore
+from fuzzylts.utils.fuzzy_system import generate_memberships, green_surface  # type: ignore
 from fuzzylts.utils.log import get_logger  # type: ignore
+from fuzzylts.utils.traci_backend import traci
 
 log = get_logger(__name__)
 
@@ -65,6 +76,7 @@ RUN_DIR: Final[Path] = Path(os.getenv("FUZZYLTS_RUN_DIR", ".")).resolve()
 # Numerics
 EPS_TIME: Final[float] = 1e-3          # protect against Δt → 0
 SMALL_QUEUE_THRESHOLD: Final[int] = 3  # use lower bound when queue is small
+RATE_BINS: Final[int] = 1001           # arrival-rate resolution of the green LUT
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Load configuration (membership functions + rules + phase→lanes mapping)
@@ -79,20 +91,76 @@ for required in ("vehicles", "arrival", "green"):
     if required not in cfg.functions:
         raise KeyError(f"Missing fuzzy membership set '{required}' in config")
 
+# Read-only, hot-path copy of the phase → lanes mapping (tuples of interned
+# lane ids instead of lists), shared with `gap_fuzzy`, plus every distinct
+# lane it references.
+PHASE_LANES: Final[Dict[TLSId, Dict[int, Tuple[LaneId, ...]]]] = {
+    tls: {phase: tuple(sys.intern(lane) for lane in lanes) for phase, lanes in phases.items()}
+    for tls, phases in cfg.phase_lanes.items()
+}
+ALL_LANES: Final[Tuple[LaneId, ...]] = tuple(
+    sorted({lane for phases in PHASE_LANES.values() for lanes in phases.values() for lane in lanes})
+)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Build fuzzy system (one-time)
 # ─────────────────────────────────────────────────────────────────────────────
 
 _vars = generate_memberships(cfg.functions)
-_rules = build_rules(cfg.rules, _vars["vehicles"], _vars["arrival"], _vars["green"])
-_fuzzy_system = ctrl.ControlSystem(_rules)
-_sim = ctrl.ControlSystemSimulation(_fuzzy_system)
 
-# Cache green bounds for clamping
-_green_lo = float(cfg.functions["green"].lmin)
-_green_hi = float(getattr(cfg.functions["green"], "lmax", _green_lo))
+# Configured green bounds, and the active ones for clamping (a run may
+# override them through `initialize_tls`; `cfg` and `_vars` stay as loaded)
+_CFG_GREEN: Final[Tuple[float, float]] = (
+    float(cfg.functions["green"].lmin), float(cfg.functions["green"].lmax)
+)
+_green_lo, _green_hi = _CFG_GREEN
+
+# Green-time lookup table over (vehicles, quantized arrival rate). scikit-fuzzy
+# clips inputs to their universes, so every vehicle count ≥ ceil(lmax) shares
+# the last row and the rate axis only spans the `arrival` universe. Rows up to
+# SMALL_QUEUE_THRESHOLD are never inferred (lower bound by design).
+_veh_hi = float(cfg.functions["vehicles"].lmax)
+_rate_lo = float(cfg.functions["arrival"].lmin)
+_rate_hi = float(cfg.functions["arrival"].lmax)
+_rate_scale = (RATE_BINS - 1) / (_rate_hi - _rate_lo)
+
+_LUT_VEHICLES = [min(float(v), _veh_hi) for v in range(SMALL_QUEUE_THRESHOLD + 1, int(ceil(_veh_hi)) + 1)]
+_LUT_RATES = _rate_lo + np.arange(RATE_BINS) / _rate_scale
+
+
+def _variables_for(lo: float, hi: float) -> Dict[str, Any]:
+    """Membership variables with the `green` universe spanning [lo, hi].
+
+    Raises:
+        ValueError: If `lo >= hi` (via `FuzzyConfig.override`).
+    """
+    if (lo, hi) == _CFG_GREEN:
+        return _vars
+    green = cfg.override(green_lmin=lo, green_lmax=hi).functions["green"]
+    return {**_vars, "green": generate_memberships({"green": green})["green"]}
+
+
+def _build_green_lut(rules: Sequence[Sequence[str]], lo: float, hi: float) -> np.ndarray:
+    """Evaluate `rules` over the (vehicles, rate bin) grid into an int16 table.
+
+    `lo`/`hi` are the `green` bounds the table is inferred and clamped with.
+
+    Tolerance: rates are snapped to the nearest of `RATE_BINS` bins before the
+    result is rounded, so a served value may differ from direct scikit-fuzzy
+    inference (clamped, rounded) by at most 1 s near a rounding boundary;
+    `tests/test_fuzzy_lut.py` asserts this bound.
+    """
+    lut = np.full((int(ceil(_veh_hi)) + 1, RATE_BINS), int(lo), dtype=np.int16)
+    surface = green_surface(_variables_for(lo, hi), rules, vehicles=_LUT_VEHICLES, rates=_LUT_RATES)
+    # No rule fired (NaN) → lower bound, as when scikit-fuzzy raises
+    surface = np.where(np.isfinite(surface), surface, lo)
+    lut[SMALL_QUEUE_THRESHOLD + 1:] = np.rint(np.clip(surface, lo, hi))
+    return lut
+
+
+_GREEN_LUT = _build_green_lut(cfg.rules, _green_lo, _green_hi)
 
-log.info("Fuzzy controller initialized with %d rules", len(_rules))
+log.info("Fuzzy controller initialized with %d rules", len(cfg.rules))
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Per-lane state for arrival-rate estimation
@@ -101,20 +169,46 @@ log.info("Fuzzy controller initialized with %d rules", len(_rules))
 
 _lane_state: Dict[LaneId, Tuple[float, int]] = {}
 
+# Green time decided on entry to each TLS's current green phase:
+# tls_id -> (phase, sim time of the last call, green duration)
+_green_cache: Dict[TLSId, Tuple[int, float, int]] = {}
+_step_length: float = 1.0  # SUMO step length, read in `initialize_tls`
+
+# Lane subscription results (lane → {var: value}), fetched once per sim time
+_lane_results: Mapping[LaneId, Mapping[int, int]] = {}
+_lane_results_time: float = float("nan")
+
+
+def lane_vehicle_number(lane: LaneId, now: float) -> int:
+    """Return the last-step vehicle count on `lane` at simulation time `now`.
+
+    Read from the lane subscription set up in `initialize_tls` (all lanes come
+    in one bulk result per step, refreshed when `now` changes); falls back to a
+    direct query for lanes that are not subscribed.
+    """
+    global _lane_results, _lane_results_time
+
+    if now != _lane_results_time:
+        _lane_results = traci.lane.getAllSubscriptionResults()
+        _lane_results_time = now
+    res = _lane_results.get(lane)
+    if res:
+        return int(res[tc.LAST_STEP_VEHICLE_NUMBER])
+    return int(traci.lane.getLastStepVehicleNumber(lane))
+
 
-def _queue_and_rate(lane: LaneId) -> Tuple[int, float]:
+def _queue_and_rate(lane: LaneId, now: float, count: int) -> Tuple[int, float]:
     """Return (queue_length, arrival_rate) and update internal state.
 
-    The arrival rate is computed as Δ(count) / Δ(time) with Δ(time) clamped
-    below by EPS_TIME to avoid division by zero.
+    `now` and `count` are fetched once by the caller. The arrival rate is
+    computed as Δ(count) / Δ(time) with Δ(time) clamped below by EPS_TIME to
+    avoid division by zero.
     """
-    now = traci.simulation.getTime()
-    count = int(traci.lane.getLastStepVehicleNumber(lane))
     prev_time, prev_count = _lane_state.get(lane, (now, count))
-    dt = max(now - prev_time, EPS_TIME)
-    rate = (count - prev_count) / dt
+    dt = now - prev_time
+    rate = (count - prev_count) / (dt if dt > EPS_TIME else EPS_TIME)
     _lane_state[lane] = (now, count)
-    return count, max(float(rate), 0.0)
+    return count, rate if rate > 0.0 else 0.0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -127,29 +221,19 @@ def _clamp(v: float, lo: float, hi: float) -> float:
 
 
 def _compute_green(vehicles: int, rate: float) -> int:
-    """Evaluate the fuzzy system to produce a green duration (seconds).
+    """Return the fuzzy green duration (seconds) via the lookup table.
 
     Logic:
     - Apply a conservative lower bound when the queue is small.
-    - Reset the scikit-fuzzy simulation to avoid residual state between steps.
-    - Clamp the result to configured bounds and round to the nearest integer.
+    - Otherwise read `_GREEN_LUT[vehicles, rate bin]` (already clamped to the
+      configured bounds and rounded to the nearest integer).
     """
     if vehicles <= SMALL_QUEUE_THRESHOLD:
         return int(_green_lo)
 
-    _sim.reset()
-    _sim.input["vehicles"] = float(vehicles)
-    _sim.input["arrival"] = float(rate)
-
-    try:
-        _sim.compute()
-        value = float(_sim.output["green"])
-    except Exception as e:  # scikit-fuzzy may raise on invalid inputs/rules
-        log.error("Fuzzy inference failed (vehicles=%s, rate=%.3f): %s", vehicles, rate, e)
-        value = _green_lo
-
-    value = _clamp(value if isfinite(value) else _green_lo, _green_lo, _green_hi)
-    return int(round(value))
+    row = min(vehicles, _GREEN_LUT.shape[0] - 1)
+    col = int((_clamp(rate, _rate_lo, _rate_hi) - _rate_lo) * _rate_scale + 0.5)
+    return int(_GREEN_LUT[row, col])
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -158,7 +242,19 @@ def _compute_green(vehicles: int, rate: float) -> int:
 
 def _phase_is_green(state: str) -> bool:
     """Heuristic: green phases contain at least one of 'g' or 'G' in `state`."""
-    return any(c in "gG" for c in state)
+    return "G" in state or "g" in state  # C-level substring checks, no generator
+
+
+def phase_and_state(tls_id: TLSId) -> Tuple[int, str]:
+    """Return `(phase_index, state_string)` for `tls_id`.
+
+    Read from the runner's per-step TLS subscription (no TraCI round-trip);
+    falls back to direct queries when no subscription is active.
+    """
+    res = traci.trafficlight.getSubscriptionResults(tls_id)
+    if res and tc.TL_CURRENT_PHASE in res:
+        return res[tc.TL_CURRENT_PHASE], res[tc.TL_RED_YELLOW_GREEN_STATE]
+    return traci.trafficlight.getPhase(tls_id), traci.trafficlight.getRedYellowGreenState(tls_id)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -169,7 +265,8 @@ def get_phase_duration(tls_id: TLSId) -> int:
     """Return a suggested green duration (seconds) for the current phase.
 
     Called on every simulation step. If the TLS is **not** in a green phase,
-    return 0 (ignored by the runner).
+    return 0 (ignored by the runner). Inference runs on the first step of a
+    green phase; later steps of the same phase return that value.
 
     Args:
         tls_id: Traffic light system identifier from the SUMO network.
@@ -177,31 +274,44 @@ def get_phase_duration(tls_id: TLSId) -> int:
     Returns:
         Integer green duration in seconds (0 if not in green).
     """
-    phase = traci.trafficlight.getPhase(tls_id)
-    phase_state = traci.trafficlight.getRedYellowGreenState(tls_id)
+    phase, phase_state = phase_and_state(tls_id)
     if not _phase_is_green(state=phase_state):
         return 0
 
     # Fetch lanes mapped to the current phase; handle missing mappings gracefully.
     try:
-        lanes = cfg.phase_lanes[tls_id][phase]
+        lanes = PHASE_LANES[tls_id][phase]
     except KeyError:
         # log.warning("No lanes mapped for tls='%s' phase=%d; returning 0", tls_id, phase)
         return 0
 
+    now = traci.simulation.getTime()
+    # Local binds: the loop below runs for every lane of every green TLS per step.
+    queue_and_rate, vehicle_number = _queue_and_rate, lane_vehicle_number
+
+    cached = _green_cache.get(tls_id)
+    if cached is not None and cached[0] == phase and now - cached[1] <= 1.5 * _step_length:
+        # Same green phase as on the previous step: the runner only applies the
+        # duration on green entry, so skip inference. Lane samples are still
+        # refreshed so the arrival-rate window stays as before.
+        for lane in lanes:
+            _lane_state[lane] = (now, vehicle_number(lane, now))
+        _green_cache[tls_id] = (phase, now, cached[2])
+        return cached[2]
+
     total_vehicles = 0
-    rates: list[float] = []
+    rate_sum, rate_n = 0.0, 0  # mean over lanes with a positive arrival rate
     for lane in lanes:
-        q, r = _queue_and_rate(lane)
+        q, r = queue_and_rate(lane, now, vehicle_number(lane, now))
         total_vehicles += q
         if r > 0:
-            rates.append(r)
+            rate_sum += r
+            rate_n += 1
 
-    avg_rate = float(np.mean(rates)) if rates else 0.0
+    avg_rate = rate_sum / rate_n if rate_n else 0.0
     green_dur = _compute_green(total_vehicles, avg_rate)
 
-    # Keep the following line for parity with the original code path (time capture).
-    _ = traci.simulation.getTime()
+    _green_cache[tls_id] = (phase, now, green_dur)
 
     log.debug(
         "Fuzzy %s phase=%d | vehicles=%d, rate=%.3f -> green=%ds",
@@ -210,13 +320,64 @@ def get_phase_duration(tls_id: TLSId) -> int:
     return green_dur
 
 
-def initialize_tls() -> None:
-    """No TLS pre-initialization needed for the fuzzy controller (no-op)."""
-    return None  # explicit no-op for interface compatibility
+def initialize_tls(*, green_lmin: float | None = None, green_lmax: float | None = None) -> None:
+    """Reset per-run state, set the run's green bounds and subscribe lane counts.
+
+    TLS programs are left as is. Called by the runner at the start of every
+    simulation, so several runs can share one process (in-process sweeps)
+    without leaking arrival-rate history.
+
+    Args:
+        green_lmin: `green` lower bound for this run (None = configured value).
+        green_lmax: `green` upper bound for this run (None = configured value).
+
+    Raises:
+        ValueError: If the resulting bounds are not `lmin < lmax`.
+    """
+    global _lane_results, _lane_results_time, _step_length
+
+    lmin = _CFG_GREEN[0] if green_lmin is None else float(green_lmin)
+    lmax = _CFG_GREEN[1] if green_lmax is None else float(green_lmax)
+    if (lmin, lmax) != (_green_lo, _green_hi):
+        _set_green_bounds(lmin, lmax)
+
+    _lane_state.clear()
+    _green_cache.clear()
+    _step_length = float(traci.simulation.getDeltaT())
+    _lane_results, _lane_results_time = {}, float("nan")
+    for lane in ALL_LANES:
+        traci.lane.subscribe(lane, (tc.LAST_STEP_VEHICLE_NUMBER,))
+
+
+def _set_green_bounds(lmin: float, lmax: float) -> None:
+    """Make [lmin, lmax] the active `green` bounds and rebuild the lookup table."""
+    global _green_lo, _green_hi, _GREEN_LUT
+
+    _GREEN_LUT = _build_green_lut(cfg.rules, lmin, lmax)  # validates first
+    _green_lo, _green_hi = lmin, lmax
+    _green_cache.clear()
+    log.info("Fuzzy green bounds set to [%g, %g]", lmin, lmax)
+
+
+def set_rules(rules: Sequence[Sequence[str]]) -> None:
+    """Replace the rule base (`[vehicles, arrival, green]` triplets) in place.
+
+    Rebuilds the green-time lookup table; `cfg.rules` alone is only read at
+    import. Raises KeyError on unknown labels, leaving the current rules intact.
+    """
+    global _GREEN_LUT
+
+    lut = _build_green_lut(rules, _green_lo, _green_hi)
+    cfg.rules = [list(r) for r in rules]
+    _GREEN_LUT = lut
+    _green_cache.clear()
 
 
 def preprocess_network(path: Path, *, out_name: str | None = None, force: bool = False) -> Path:
     """Delegate to the static controller's network preprocessor (no topology changes)."""
+    # Deferred to first use: importing `static` also loads its StaticConfig.
+    from fuzzylts.controllers import static  # type: ignore
+
     return static.preprocess_network(path=path, out_name=out_name, force=force)
 
 
@@ -224,4 +385,6 @@ __all__ = [
     "get_phase_duration",
     "initialize_tls",
     "preprocess_network",
+    "lane_vehicle_number",
+    "set_rules",
 ]
@@ -15,28 +15,28 @@ Otherwise, delegate green extension to the fuzzy controller.
 Public API (controller protocol)
 --------------------------------
 - get_phase_duration(tls_id): int
-- initialize_tls(): None
+- initialize_tls(green_lmin=None, green_lmax=None): None
 - preprocess_network(path): Path
 
 Notes
 -----
 - Green phases are detected from the binary state string: presence of 'g' or 'G'.
+  Each TLS's green phase indices are taken from its running program once, in
+  `initialize_tls`, so the per-step check is a set lookup on the phase index.
 - This controller shares the **phase → lanes** mapping already loaded by the
-  fuzzy controller configuration.
+  fuzzy controller configuration, and its per-step lane-count subscription.
 """
 
 from __future__ import annotations
 
 from collections import defaultdict
 from pathlib import Path
-from typing import DefaultDict, Final
-
-import traci
+from typing import DefaultDict, Dict, Final, FrozenSet
 
 # Keep imports aligned with your existing package layout.
 from fuzzylts.controllers import fuzzy  # type: ignore
-from fuzzylts.controllers import static  # type: ignore
 from fuzzylts.utils.log import get_logger  # type: ignore
+from fuzzylts.utils.traci_backend import traci
 
 __all__ = ["get_phase_duration", "initialize_tls", "preprocess_network"]
 
@@ -62,6 +62,14 @@ NO_VEHICLE_LIMIT: Final[float] = 2     # consecutive seconds with no vehicles to
 _empty_time: DefaultDict[TLSId, float] = defaultdict(float)  # seconds with zero vehicles
 _green_time: DefaultDict[TLSId, float] = defaultdict(float)  # seconds since green started
 
+# Per-TLS program facts, constant during a run (filled in `initialize_tls`):
+# phase count and the indices of green phases.
+_num_phases: Dict[TLSId, int] = {}
+_green_phases: Dict[TLSId, FrozenSet[int]] = {}
+
+# SUMO step length in seconds (fixed for a run; read in `initialize_tls`)
+_DT: float = 1.0
+
 
 def _reset_timers(tls_id: TLSId) -> None:
     """Reset per-TLS timers (green dwell and empty-lane dwell)."""
@@ -74,7 +82,7 @@ def _reset_timers(tls_id: TLSId) -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 def _phase_is_green(state: str) -> bool:
     """Heuristic: treat any 'g' or 'G' in the state string as a green phase."""
-    return any(c in "gG" for c in state)
+    return "G" in state or "g" in state  # C-level substring checks, no generator
 
 
 def _gap_fuzzy(tls_id: TLSId) -> int:
@@ -84,40 +92,35 @@ def _gap_fuzzy(tls_id: TLSId) -> int:
     phase; returns 0 for non-green phases. The runner applies the duration only
     upon entering green phases (so returning 0 outside green is expected).
     """
-    phase = traci.trafficlight.getPhase(tls_id)
-    phase_state = traci.trafficlight.getRedYellowGreenState(tls_id)
+    phase, _ = fuzzy.phase_and_state(tls_id)
 
     # Only operate on green phases; reset timers for others (yellow/red).
-    if not _phase_is_green(state=phase_state):
+    if phase not in _green_phases.get(tls_id, ()):
         _reset_timers(tls_id)
         return 0
 
     # Lanes mapped to the current phase (shared mapping from fuzzy controller config).
     try:
-        lanes = fuzzy.cfg.phase_lanes[tls_id][phase]
+        lanes = fuzzy.PHASE_LANES[tls_id][phase]
     except KeyError:
         # No mapping available → nothing to do here; reset for safety.
         _reset_timers(tls_id)
         return 0
 
-    # Aggregate vehicle count across mapped lanes for the current step.
-    vehs = sum(int(traci.lane.getLastStepVehicleNumber(l)) for l in lanes)
+    # Aggregate vehicle count across mapped lanes for the current step, read
+    # from the lane subscription set up by `fuzzy.initialize_tls`.
+    now = traci.simulation.getTime()
+    vehicle_number = fuzzy.lane_vehicle_number
+    vehs = sum(vehicle_number(l, now) for l in lanes)
 
     # Advance timers using SUMO's deltaT (robust to non-1.0 step lengths).
-    dt = float(traci.simulation.getDeltaT())
+    dt = _DT
     _green_time[tls_id] += dt
     _empty_time[tls_id] = (_empty_time[tls_id] + dt) if vehs == 0 else 0.0
 
     # Gap-out: enough green elapsed AND no vehicles for a while.
     if _green_time[tls_id] >= MIN_GREEN and _empty_time[tls_id] >= NO_VEHICLE_LIMIT:
-        try:
-            num_phases = int(traci.trafficlight.getPhaseNumber(tls_id))
-        except Exception:
-            # Fallback: derive from the active program definition.
-            logic = traci.trafficlight.getAllProgramLogics(tls_id)[0]
-            num_phases = len(logic.getPhases())
-
-        next_phase = (phase + 1) % num_phases
+        next_phase = (phase + 1) % _num_phases[tls_id]
         traci.trafficlight.setPhase(tls_id, next_phase)
 
         log.debug(
@@ -140,11 +143,32 @@ def get_phase_duration(tls_id: TLSId) -> int:
     return _gap_fuzzy(tls_id)
 
 
-def initialize_tls() -> None:
-    """No TLS pre-initialization required (kept for protocol compatibility)."""
-    return None  # no-op
+def initialize_tls(*, green_lmin: float | None = None, green_lmax: float | None = None) -> None:
+    """Reset per-run state (gap-out timers, phase counts, fuzzy controller state).
+
+    Called by the runner at the start of every simulation, so several runs can
+    share one process (in-process sweeps) without leaking timers. The green
+    bounds are forwarded to `fuzzy.initialize_tls`.
+    """
+    global _DT
+
+    _empty_time.clear()
+    _green_time.clear()
+    _DT = float(traci.simulation.getDeltaT())
+    _num_phases.clear()
+    _green_phases.clear()
+    for tls in fuzzy.PHASE_LANES:
+        logics = traci.trafficlight.getAllProgramLogics(tls)
+        current = traci.trafficlight.getProgram(tls)
+        phases = {L.programID: L for L in logics}.get(current, logics[0]).phases
+        _num_phases[tls] = len(phases)
+        _green_phases[tls] = frozenset(i for i, p in enumerate(phases) if _phase_is_green(p.state))
+    fuzzy.initialize_tls(green_lmin=green_lmin, green_lmax=green_lmax)
 
 
 def preprocess_network(path: Path, *, out_name: str | None = None, force: bool = False) -> Path:
     """Build (or reuse) the static-controller network (no special preprocessing needed)."""
+    # Deferred to first use: importing `static` also loads its StaticConfig.
+    from fuzzylts.controllers import static  # type: ignore
+
     return static.preprocess_network(path=path, out_name=out_name, force=force)
@@ -21,22 +21,23 @@ Notes
 
 from __future__ import annotations
 
+import logging
 import os
-import subprocess
+from collections import deque
 from dataclasses import dataclass  # kept to avoid changing imports surface
 from pathlib import Path
 from shutil import which
 from typing import List, Optional
 
-import traci
 import traci.constants as tc
-from traci import trafficlight as tl
 
 # Keep import path consistent with your codebase layout.
 from fuzzylts.config.static_config import StaticConfig  # type: ignore
 from fuzzylts.utils.log import get_logger  # type: ignore
+from fuzzylts.utils.traci_backend import traci
 
 log = get_logger(__name__)
+tl = traci.trafficlight  # resolved against the selected backend (traci or libsumo)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants
@@ -45,6 +46,10 @@ log = get_logger(__name__)
 STATIC_TYPE: int = tc.TRAFFICLIGHT_TYPE_STATIC  # TraCI constant
 NET_ENV_VAR: str = "TARGET_NET_XML"             # input .net.xml from env (if used elsewhere)
 
+# Extra TLS variables the runner adds to its per-step TLS subscription
+# (SUMO keeps one variable list per object, so the runner owns it).
+TLS_SUBSCRIPTION_VARS: tuple[int, ...] = (tc.TL_PHASE_DURATION,)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration (path injected via env for reproducibility)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -82,22 +87,14 @@ def _make_static_phases(
     Returns:
         A list of `tl.Phase` with fixed durations.
     """
-    out: List[tl.Phase] = []
-    for p in phases_in:
-        if _phase_is_yellow(p.state):
-            duration = minDur = maxDur = int(yellow_fix)
-        else:
-            duration = minDur = maxDur = int(green_fix)
-
-        out.append(
-            tl.Phase(
-                duration=duration,
-                state=p.state,
-                minDur=minDur,
-                maxDur=maxDur,
-            )
-        )
-    return out
+    # Fixed duration (= minDur = maxDur) per phase, resolved once per call.
+    green, yellow = int(green_fix), int(yellow_fix)
+    durations = [yellow if _phase_is_yellow(p.state) else green for p in phases_in]
+
+    return [
+        tl.Phase(duration=d, state=p.state, minDur=d, maxDur=d)
+        for p, d in zip(phases_in, durations)
+    ]
 
 
 def build_static_logic_from(
@@ -146,7 +143,7 @@ def initialize_tls() -> None:
     for tls_id in cfg.tls:
         current_prog = tl.getProgram(tls_id)
         logics = tl.getAllProgramLogics(tls_id)
-        base = next((L for L in logics if getattr(L, "programID", None) == current_prog), logics[0])
+        base = {L.programID: L for L in logics}.get(current_prog, logics[0])
 
         new_logic = build_static_logic_from(
             base,
@@ -164,14 +161,25 @@ def initialize_tls() -> None:
 # ─────────────────────────────────────────────────────────────────────────────
 
 def get_phase_duration(tls_id: str) -> float:
-    """Return the configured duration (seconds) of the current phase for `tls_id`."""
-    return float(tl.getPhaseDuration(tls_id))
+    """Return the configured duration (seconds) of the current phase for `tls_id`.
+
+    Served from the runner's TLS subscription (see `TLS_SUBSCRIPTION_VARS`);
+    falls back to a direct query when no subscription is active.
+    """
+    res = tl.getSubscriptionResults(tls_id)
+    if not res or tc.TL_PHASE_DURATION not in res:
+        return float(tl.getPhaseDuration(tls_id))
+    return float(res[tc.TL_PHASE_DURATION])
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Network preprocessing (netconvert)
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Lines of netconvert output kept for the error message on failure
+_NETCONVERT_TAIL_LINES = 200
+
+
 class NetworkBuildError(RuntimeError):
     """Raised when `netconvert` fails to rebuild the network."""
 
@@ -224,7 +232,12 @@ def preprocess_network(
         log.info("Using existing network: %s", output)
         return output
 
+    import subprocess  # deferred: only needed when the network must be rebuilt
+
     netconvert = _resolve_netconvert()
+    # Write to a per-process temp file and rename atomically, so concurrent
+    # runs (parallel sweeps) never observe a partially written network.
+    tmp_output = output.with_name(f"{output.stem}.{os.getpid()}.tmp{output.suffix}")
     cmd = [
         netconvert,
         "-s",
@@ -234,7 +247,7 @@ def preprocess_network(
         "--tls.default-type",
         "static",
         "-o",
-        str(output),
+        str(tmp_output),
     ]
 
     # Append tls_* options according to cfg
@@ -249,17 +262,29 @@ def preprocess_network(
     log.info("Running netconvert to rebuild TLS as static.")
     log.debug("Command: %s", " ".join(cmd))
 
-    try:
-        proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        if proc.stdout:
-            log.debug("netconvert stdout:\n%s", proc.stdout)
-        if proc.stderr:
-            # netconvert can output informational lines on stderr even on success
-            log.debug("netconvert stderr:\n%s", proc.stderr)
-    except subprocess.CalledProcessError as e:
-        msg = f"netconvert failed (code {e.returncode}). Stderr:\n{e.stderr}"
+    # Stream netconvert's output instead of buffering all of it (stderr is
+    # very verbose on large maps): only a bounded tail is kept for the error
+    # message, and at DEBUG each line is logged as it arrives.
+    debug = log.isEnabledFor(logging.DEBUG)
+    tail: deque[str] = deque(maxlen=_NETCONVERT_TAIL_LINES)
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE if debug else subprocess.DEVNULL,
+        stderr=subprocess.STDOUT if debug else subprocess.PIPE,
+        text=True,
+    ) as proc:
+        for line in proc.stdout if debug else proc.stderr:  # type: ignore[union-attr]
+            tail.append(line)
+            if debug:
+                log.debug("netconvert: %s", line.rstrip())
+
+    if proc.returncode != 0:
+        tmp_output.unlink(missing_ok=True)
+        msg = f"netconvert failed (code {proc.returncode}). Stderr (last {len(tail)} lines):\n{''.join(tail)}"
         log.error(msg)
-        raise NetworkBuildError(msg) from e
+        raise NetworkBuildError(msg)
+
+    os.replace(tmp_output, output)
 
     log.info("Wrote static network: %s", output)
     return output
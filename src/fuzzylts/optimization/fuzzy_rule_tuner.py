@@ -7,17 +7,31 @@ No YAML rewrites and no subprocesses – much faster than spawning SUMO
 for every candidate.  The neighbourhood is richer than a simple ±1
 shift, and the schedule auto-reheats if the search stalls.
 
+By default (``--workers 1``) each iteration proposes one neighbour: the
+classic serial search.  ``--workers N`` proposes N neighbours per
+iteration, simulates them in a process pool and runs the SA acceptance
+test on the best one.  Scores are cached per (scenario, seed, rule
+matrix) in ``sim_cache.jsonl`` under the work dir, so repeated
+candidates and resumed searches skip the simulation.
+
+Every improvement is appended to ``history.jsonl``; the best rule base is
+written once, to ``best.yaml``, when the search ends.
+
 Example
 -------
 python -m fuzzylts.optimization.fuzzy_rule_tuner \
-       --scenario medium --seed 0 --iters 100
+       --scenario medium --seed 0 --iters 100             # serial
+python -m fuzzylts.optimization.fuzzy_rule_tuner \
+       --scenario medium --seed 0 --iters 100 --workers 8 # 8 per iteration
 """
 from __future__ import annotations
 
 import argparse
+import json
 import logging
 import math
 import random
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -27,17 +41,17 @@ import os
 
 from fuzzylts.controllers import fuzzy as ctl
 from fuzzylts.sim.runner   import run_sumo_once
-from fuzzylts.utils.io     import tripinfo_xml_to_df
+from fuzzylts.utils.io     import summarize_tripinfo
 
 # ─────────────────── static paths & levels ──────────────────────────────
 ROOT       = Path(__file__).resolve().parents[3]
 SUMOCFG    = ROOT / "sumo_files" / "osm_fuzzy.sumocfg"
 ROUTES_TPL = ROOT / "sumo_files" / "generated_routes_{scenario}.rou.xml"
+NET_XML    = ROOT / "sumo_files" / "osm.net.xml"
 
 GREEN_LEVELS = ["very_short", "short", "normal", "long", "very_long"]
 
 LOG_FMT = "%(asctime)s | %(levelname)-8s | %(message)s"
-logging.basicConfig(level=logging.INFO, format=LOG_FMT, datefmt="%H:%M:%S")
 log = logging.getLogger("rule-tuner")
 
 # ───────────────────────── helpers  ─────────────────────────────────────
@@ -53,24 +67,27 @@ def matrix_to_rules(mat: RuleMat) -> RuleListT:
 
 # -------------------------- neighbourhood -------------------------------
 
-def shift_one_level(mat: RuleMat) -> RuleMat:
+# Moves draw cells from `keys`, the matrix's key tuple: every move keeps the
+# key set, so `main` builds it once instead of `list(mat)` per proposal.
+
+def shift_one_level(mat: RuleMat, keys: Tuple[RuleKey, ...]) -> RuleMat:
     """±1 step for a single rule (your original move)."""
     new = mat.copy()
-    k   = random.choice(list(new))
+    k   = random.choice(keys)
     idx = GREEN_LEVELS.index(new[k]) + random.choice([-1, 1])
     new[k] = GREEN_LEVELS[max(0, min(len(GREEN_LEVELS) - 1, idx))]
     return new
 
-def random_reassign(mat: RuleMat) -> RuleMat:
+def random_reassign(mat: RuleMat, keys: Tuple[RuleKey, ...]) -> RuleMat:
     new = mat.copy()
-    k   = random.choice(list(new))
+    k   = random.choice(keys)
     new[k] = random.choice(GREEN_LEVELS)
     return new
 
-def swap_two(mat: RuleMat) -> RuleMat:
+def swap_two(mat: RuleMat, keys: Tuple[RuleKey, ...]) -> RuleMat:
     """Swap the outputs of two random cells."""
     new = mat.copy()
-    k1, k2 = random.sample(list(new), 2)
+    k1, k2 = random.sample(keys, 2)
     new[k1], new[k2] = new[k2], new[k1]
     return new
 
@@ -80,19 +97,69 @@ MOVES = (shift_one_level, random_reassign, swap_two)
 
 def simulate(mat_rules: RuleMat, scenario: str,
              seed: int, out_dir: Path) -> float:
-    """Run one SUMO sim and return mean waiting time."""
-    ctl.cfg.rules = matrix_to_rules(mat_rules)          # hot-swap rule base
+    """Run one SUMO sim and return mean waiting time.
+
+    Top-level and driven only by its arguments, so it can run in pool workers.
+    """
+    ctl.set_rules(matrix_to_rules(mat_rules))           # hot-swap rule base
     routes = Path(str(ROUTES_TPL).format(scenario=scenario))
     os.environ['FUZZYLTS_RUN_DIR'] = str(out_dir)
     tripinfo_xml, _ = run_sumo_once(
-        controller="fuzzy",
+        sumo_binary="sumo",
+        controller_name="fuzzy",
+        net_xml=NET_XML,
         routes_xml=routes,
         sumocfg=SUMOCFG,
         output_dir=out_dir,
         sim_seed=seed,
     )
-    df = tripinfo_xml_to_df(tripinfo_xml)
-    return float(df["waitingTime"].mean())
+    return float(summarize_tripinfo(tripinfo_xml)["mean_waitingTime"])
+
+def _simulate_task(task: Tuple[RuleMat, str, int, Path]) -> float:
+    """`simulate` over one packed argument tuple (for `Executor.map`)."""
+    return simulate(*task)
+
+# ---------------------------- sim cache ---------------------------------
+# (scenario, seed, sorted rule cells) → mean waiting time. Revisited
+# matrices (moves undoing each other, duplicate proposals in a batch) and
+# resumed searches reuse earlier runs instead of simulating again.
+SimKey = Tuple[str, int, Tuple[Tuple[RuleKey, str], ...]]
+_sim_cache: Dict[SimKey, float] = {}
+
+def _sim_key(mat: RuleMat, scenario: str, seed: int) -> SimKey:
+    return scenario, seed, tuple(sorted(mat.items()))
+
+def load_sim_cache(path: Path) -> None:
+    """Fill the sim cache from a JSONL file written by `evaluate`."""
+    if not path.exists():
+        return
+    for line in path.read_text(encoding="utf-8").splitlines():
+        rec = json.loads(line)
+        _sim_cache[_sim_key(rules_to_matrix(rec["rules"]),
+                            rec["scenario"], rec["seed"])] = rec["wait"]
+
+def evaluate(cands: List[RuleMat], scenario: str, seed: int,
+             out_dirs: List[Path], pool: ProcessPoolExecutor | None,
+             cache_file: Path) -> List[float]:
+    """Score each candidate, simulating every unseen matrix only once.
+
+    New results are added to the sim cache and appended to `cache_file`.
+    """
+    keys = [_sim_key(c, scenario, seed) for c in cands]
+    todo: Dict[SimKey, int] = {}               # key → first candidate index
+    for j, key in enumerate(keys):
+        if key not in _sim_cache and key not in todo:
+            todo[key] = j
+
+    tasks = [(cands[j], scenario, seed, out_dirs[j]) for j in todo.values()]
+    runner = pool.map if pool is not None and len(tasks) > 1 else map
+    with cache_file.open("a", encoding="utf-8") as fh:
+        for (key, j), wait in zip(todo.items(), runner(_simulate_task, tasks)):
+            _sim_cache[key] = wait
+            fh.write(json.dumps({"scenario": scenario, "seed": seed,
+                                 "rules": matrix_to_rules(cands[j]),
+                                 "wait": wait}) + "\n")
+    return [_sim_cache[key] for key in keys]
 
 # ─────────────────────────── main loop ──────────────────────────────────
 def main() -> None:
@@ -101,67 +168,99 @@ def main() -> None:
                     choices=["low", "medium", "high", "very_high"])
     ap.add_argument("--seed", type=int, default=0)
     ap.add_argument("--iters", type=int, default=100)
+    ap.add_argument("--workers", type=int, default=1,
+                    help="neighbours proposed per iteration, simulated in a "
+                         "process pool when > 1 (default: 1 = classic serial SA)")
     args = ap.parse_args()
+    # configured here, not at import: pool workers and importers keep theirs
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO, format=LOG_FMT, datefmt="%H:%M:%S")
     random.seed(args.seed)
+    k = max(1, args.workers)
 
     work = ROOT / "experiments" / "rule_tune" / args.scenario
     work.mkdir(parents=True, exist_ok=True)
 
-    # baseline
-    best_mat = rules_to_matrix(ctl.cfg.rules)
-    best     = simulate(best_mat, args.scenario, args.seed, work / "run_00")
-    log.info("[00] baseline avg_wait = %.3fs", best)
-
-    # SA hyper-params
-    T_init          = 2.0
-    T_reheat        = 1.0          # temp when plateau detected
-    stall_patience  = 10           # iterations without improvement → reheating
-    early_stop      = 8            # stop if < tol improvement *early_stop* times
-    tol             = 0.02         # 0.02 s improvement considered negligible
-
-    no_improve = 0
-    small_imp  = 0
-
-    prog = trange(1, args.iters + 1, unit="iter")
-    for i in prog:
-        T = T_init * (1 - i / args.iters)
-
-        # pick a move type at random
-        neighbour_fn = random.choice(MOVES)
-        cand_mat     = neighbour_fn(best_mat)
-        score        = simulate(cand_mat, args.scenario,
-                                args.seed + i, work / f"run_{i:03d}")
-
-        delta   = score - best
-        accept  = delta < 0 or random.random() < math.exp(-delta / max(T, 1e-6))
-
-        if accept:
-            best_mat = cand_mat
-            if score < best:
-                imp = best - score
-                best = score
-                (work / f"best_{best:.3f}.yaml").write_text(
-                    yaml.safe_dump({"rules": matrix_to_rules(best_mat)},
-                                   allow_unicode=True)
-                )
-                no_improve = 0
-                small_imp  = 0 if imp > tol else small_imp + 1
-            else:
-                no_improve += 1
-        else:
-            no_improve += 1
-
-        # plateau? → reheat
-        if no_improve >= stall_patience:
-            T_init = T_reheat
-            no_improve = 0
-            prog.write("↺  reheating temperature")
-
-        prog.set_postfix(wait=f"{best:.3f}s", T=f"{T:.2f}")
-
-        if small_imp >= early_stop:
-            prog.write("Early-stop: improvements below tol")
-            break
+    cache_file = work / "sim_cache.jsonl"
+    load_sim_cache(cache_file)
+
+    # one process per candidate slot; workers live for the whole search.
+    # The finally block shuts them down and saves best.yaml even when a
+    # simulation raises part-way through.
+    pool = ProcessPoolExecutor(max_workers=k) if k > 1 else None
+    best_rules = None
+    try:
+        # baseline
+        best_mat = rules_to_matrix(ctl.cfg.rules)
+        keys     = tuple(best_mat)
+        best, = evaluate([best_mat], args.scenario, args.seed,
+                         [work / "run_00"], None, cache_file)
+        best_rules = matrix_to_rules(best_mat)
+        log.info("[00] baseline avg_wait = %.3fs", best)
+
+        # SA hyper-params
+        T_init          = 2.0
+        T_reheat        = 1.0          # temp when plateau detected
+        stall_patience  = 10           # iterations without improvement → reheating
+        early_stop      = 8            # stop if < tol improvement *early_stop* times
+        tol             = 0.02         # 0.02 s improvement considered negligible
+
+        no_improve = 0
+        small_imp  = 0
+
+        # one JSONL line per improvement; the YAML snapshot is written at exit
+        with (work / "history.jsonl").open("a", encoding="utf-8") as history:
+            prog = trange(1, args.iters + 1, unit="iter")
+            for i in prog:
+                T = T_init * (1 - i / args.iters)
+
+                # propose k neighbours (random move type each) and keep the
+                # best; they share the iteration's sim seed so their scores
+                # are comparable
+                cands = [random.choice(MOVES)(best_mat, keys) for _ in range(k)]
+                out_dirs = ([work / f"run_{i:03d}"] if k == 1 else
+                            [work / f"run_{i:03d}_{j}" for j in range(k)])
+                scores = evaluate(cands, args.scenario, args.seed + i,
+                                  out_dirs, pool, cache_file)
+                score, cand_mat = min(zip(scores, cands), key=lambda sc: sc[0])
+
+                delta   = score - best
+                accept  = delta < 0 or random.random() < math.exp(-delta / max(T, 1e-6))
+
+                if accept:
+                    best_mat = cand_mat
+                    if score < best:
+                        imp = best - score
+                        best = score
+                        best_rules = matrix_to_rules(best_mat)
+                        history.write(json.dumps({"iter": i, "wait": best,
+                                                  "rules": best_rules}) + "\n")
+                        history.flush()
+                        no_improve = 0
+                        small_imp  = 0 if imp > tol else small_imp + 1
+                    else:
+                        no_improve += 1
+                else:
+                    no_improve += 1
+
+                # plateau? → reheat
+                if no_improve >= stall_patience:
+                    T_init = T_reheat
+                    no_improve = 0
+                    prog.write("↺  reheating temperature")
+
+                prog.set_postfix(wait=f"{best:.3f}s", T=f"{T:.2f}")
+
+                if small_imp >= early_stop:
+                    prog.write("Early-stop: improvements below tol")
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if best_rules is not None:
+            (work / "best.yaml").write_text(
+                yaml.safe_dump({"rules": best_rules}, allow_unicode=True)
+            )
 
     log.info("✓ optimisation finished – best avg_wait = %.3fs", best)
 
@@ -1,73 +1,70 @@
 # src/fuzzylts/optimization/fuzzy_tuner.py
 
-import subprocess
-import yaml
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
+from typing import Any, Dict, Tuple
 
 import pandas as pd
-from fuzzylts.utils.stats import load_experiment_metrics
-
-# where to find your fuzzy controller config
-FUZZY_CFG = Path(__file__).resolve().parents[3] / "configs" / "controller" / "fuzzy.yaml"
+from fuzzylts.pipelines import run_experiment
 
 # the scenarios and seeds you want to test
 SCENARIOS = ["low", "medium", "high", "very_high"]
 SEEDS     = [0, 1, 2, 3, 4]
 
-def run_all(controller: str, scenario: str, seed: int) -> None:
-    """Invoke your run_experiment script."""
-    cmd = [
-        "python", "-m", "fuzzylts.pipelines.run_experiment",
-        "--controller", controller,
-        "--scenario",   scenario,
-        "--seed",       str(seed),
-    ]
-    subprocess.run(cmd, check=True)
+# (green lmin, green lmax, scenario, seed)
+GridTask = Tuple[float, float, str, int]
 
-def tune_green_bounds(lmin_vals, lmax_vals):
+def run_all(controller: str, scenario: str, seed: int,
+            green_lmin: float | None = None, green_lmax: float | None = None) -> Dict[str, Any]:
+    """Run one experiment in this process and return its metrics.
+
+    Calls `run_experiment.run` directly: no interpreter start-up or package
+    re-import per run. Errors propagate as before (a failed run aborts the grid).
+    """
+    return run_experiment.run(
+        controller=controller,
+        scenario=scenario,
+        seed=seed,
+        green_lmin=green_lmin,
+        green_lmax=green_lmax,
+    )
+
+def run_one(task: GridTask) -> Dict[str, Any]:
+    """Run one grid point (fuzzy controller) and return its metrics row."""
+    lmin, lmax, scenario, seed = task
+    metrics = run_all("fuzzy", scenario, seed, green_lmin=lmin, green_lmax=lmax)
+    return {"lmin": lmin, "lmax": lmax, "scenario": scenario, "seed": seed,
+            "avg_wait": metrics["avg_wait"]}
+
+def tune_green_bounds(lmin_vals, lmax_vals, workers: int | None = None):
     """
     Grid-search over pairs of (lmin, lmax) for the 'green' membership function.
+
+    Every (lmin, lmax, scenario, seed) run is independent, so the flat grid is
+    spread over a process pool (`workers`, default: CPU count). Bounds are passed
+    to each run as overrides; the YAML config is never rewritten.
     Returns a DataFrame of results.
     """
-    results = []
-    base = yaml.safe_load(FUZZY_CFG.read_text())
-
-    for lmin, lmax in product(lmin_vals, lmax_vals):
-        # skip invalid configs
-        if lmin >= lmax:
-            continue
-
-        # patch config
-        cfg = base.copy()
-        cfg["functions"]["green"]["lmin"] = float(lmin)
-        cfg["functions"]["green"]["lmax"] = float(lmax)
-        # write it back
-        FUZZY_CFG.write_text(yaml.safe_dump(cfg), encoding="utf-8")
-
-        # run experiments
-        for scenario in SCENARIOS:
-            for seed in SEEDS:
-                run_all("fuzzy", scenario, seed)
-
-        # collect metrics
-        df = load_experiment_metrics()
-        # only take fuzzy runs
-        df_fz = df[df.controller == "fuzzy"]
-
-        # compute mean waiting time across all scenarios & seeds
-        mean_wait = df_fz["avg_wait"].mean()
-        results.append({
-            "lmin": lmin,
-            "lmax": lmax,
-            "mean_wait": mean_wait
-        })
-        print(f"Tested green=[{lmin},{lmax}] → mean_wait={mean_wait:.2f}s")
-
-    # restore original config
-    FUZZY_CFG.write_text(yaml.safe_dump(base), encoding="utf-8")
-
-    return pd.DataFrame(results)
+    tasks = [
+        (float(lmin), float(lmax), scenario, seed)
+        for lmin, lmax in product(lmin_vals, lmax_vals)
+        if lmin < lmax                      # skip invalid configs
+        for scenario in SCENARIOS
+        for seed in SEEDS
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        runs = pd.DataFrame(list(ex.map(run_one, tasks)))
+
+    # mean waiting time across all scenarios & seeds
+    results = (
+        runs.groupby(["lmin", "lmax"], as_index=False, sort=False)["avg_wait"]
+        .mean()
+        .rename(columns={"avg_wait": "mean_wait"})
+    )
+    for row in results.itertuples(index=False):
+        print(f"Tested green=[{row.lmin:g},{row.lmax:g}] → mean_wait={row.mean_wait:.2f}s")
+
+    return results
 
 
 if __name__ == "__main__":
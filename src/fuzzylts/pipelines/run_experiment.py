@@ -9,11 +9,21 @@ then save outputs and summary metrics in:  `experiments/<run_id>/`.
 
 The pipeline:
 1) Parse CLI arguments (controller, scenario, seed, etc.).
-2) Create a temporary `.sumocfg` overriding route-files and seed.
-3) Execute one SUMO run via `fuzzylts.sim.runner.run_sumo_once(...)`.
-4) Post-process outputs (tripinfo.xml, stats.xml) → JSON metrics.
+2) Resolve the routes file and the base `.sumocfg` (used as is; no temp copy).
+3) Execute one SUMO run via `fuzzylts.sim.runner.run_sumo_once(...)`, which
+   passes route-files and seed as SUMO CLI options (they override the XML).
+4) Post-process outputs → JSON metrics: trip means come from one streaming
+   pass over tripinfo.xml (no DataFrame). With `--sumo-trip-stats` they are
+   taken from SUMO's `<vehicleTripStatistics>` in stats.xml instead (rounded
+   to SUMO's output precision) when present; `metrics_source` in
+   metrics.json records which one was used.
 5) Persist run configuration and metrics under the run directory.
 
+Steps 2–5 live in `run(...)`, which sweep drivers can import and call
+in-process; `run_one(args)` does the same from a parsed namespace, and
+`run_sweep(configs, workers)` fans such namespaces out over a process pool.
+`main()` only parses the CLI and configures logging.
+
 Notes
 -----
 - This script assumes **pre-generated routes** exist in `sumo_files/`:
@@ -27,7 +37,8 @@ Usage
         --controller <static|actuated|fuzzy|gap_fuzzy> \
         --scenario <low|medium|high|very_high|medium_extended> \
         --seed 1 \
-        --net-file cuenca.net.xml.gz
+        --net-file cuenca.net.xml.gz \
+        [--green-lmin 10 --green-lmax 50] [--sumo-trip-stats]
 """
 
 from __future__ import annotations
@@ -36,13 +47,13 @@ import argparse
 import json
 import logging
 import os
-import uuid
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, List, Sequence
 
 from fuzzylts.sim.runner import run_sumo_once  # type: ignore
-from fuzzylts.utils.io import tripinfo_xml_to_df, stats_xml_to_dict  # type: ignore
+from fuzzylts.utils.io import summarize_tripinfo, stats_xml_to_dict  # type: ignore
 from fuzzylts.utils.log import get_logger  # type: ignore
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -53,17 +64,26 @@ ROOT_DIR = Path(__file__).resolve().parents[3]
 SUMO_DIR = ROOT_DIR / "sumo_files"
 EXP_DIR = ROOT_DIR / "experiments"
 
+# `<vehicleTripStatistics>` attributes (statistic-output) that replace the
+# tripinfo pass when `--sumo-trip-stats` is given
+_TRIP_STATS_KEYS = ("count", "waitingTime", "duration", "speed")
+
 log = get_logger(__name__)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CLI
 # ─────────────────────────────────────────────────────────────────────────────
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments.
 
+    Args:
+        argv: Arguments to parse (default: `sys.argv[1:]`). Sweep drivers can
+            build `run_sweep` configs with e.g. `parse_args(["-c", "fuzzy", "-s", "low"])`.
+
     Returns:
-        An argparse.Namespace with controller, scenario, seed, sumo-binary, net-file, and log_level.
+        An argparse.Namespace with controller, scenario, seed, sumo-binary, net-file,
+        green bounds, sumo_trip_stats, and log_level.
     """
     parser = argparse.ArgumentParser(
         description="Run one SUMO simulation with a given controller and scenario."
@@ -100,84 +120,104 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Random seed for SUMO (default: 0).",
     )
+    parser.add_argument(
+        "--green-lmin",
+        type=float,
+        default=None,
+        help="Override the fuzzy 'green' lower bound (s) from the YAML config.",
+    )
+    parser.add_argument(
+        "--green-lmax",
+        type=float,
+        default=None,
+        help="Override the fuzzy 'green' upper bound (s) from the YAML config.",
+    )
+    parser.add_argument(
+        "--sumo-trip-stats",
+        action="store_true",
+        help="Take trip means from SUMO's <vehicleTripStatistics> (stats.xml, "
+        "rounded) instead of tripinfo.xml; recorded as metrics_source.",
+    )
     parser.add_argument(
         "--log-level",
         default=os.getenv("FUZZYLTS_LOG_LEVEL", "INFO"),
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Logging verbosity level.",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# SUMO .sumocfg overrides
+# Output helpers
 # ─────────────────────────────────────────────────────────────────────────────
-def override_sumocfg(base_cfg: Path, overrides: Dict[str, str]) -> Path:
-    """Copy a SUMO config and inject new route-files and seed values.
-
-    Args:
-        base_cfg: Path to the original `.sumocfg`.
-        overrides: Mapping with keys:
-            - 'route-files': path to routes XML
-            - 'seed': integer seed as string
+def _write_json_atomic(path: Path, obj: Dict[str, Any]) -> None:
+    """Write `obj` as indented JSON via a temp file + rename.
 
-    Returns:
-        Path to a temporary `.sumocfg` file with overrides applied.
+    Readers (e.g. `load_experiment_metrics` during a parallel sweep) never see
+    a half-written file, even if the run is killed mid-write.
     """
-    tree = ET.parse(base_cfg)
-    root = tree.getroot()
-    input_elem = root.find("input") or ET.SubElement(root, "input")
-
-    # Remove any existing <route-files> elements and set the new one
-    for elem in input_elem.findall("route-files"):
-        input_elem.remove(elem)
-    ET.SubElement(input_elem, "route-files").set("value", overrides["route-files"])
-
-    # Update or add <seed>
-    seed_elem = root.find(".//seed")
-    if seed_elem is None:
-        seed_elem = ET.SubElement(input_elem, "seed")
-    seed_elem.set("value", overrides["seed"])
-
-    temp_name = f"_temp_{uuid.uuid4().hex[:6]}_{base_cfg.name}"
-    temp_cfg = base_cfg.parent / temp_name
-    tree.write(temp_cfg, encoding="utf-8", xml_declaration=True)
-    return temp_cfg
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(obj, indent=2))
+    os.replace(tmp, path)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Main
+# Single run (importable)
 # ─────────────────────────────────────────────────────────────────────────────
-def main() -> None:
-    """Run one simulation and persist outputs + summary metrics."""
-    args = parse_args()
+def run(
+    controller: str,
+    scenario: str,
+    seed: int = 0,
+    net_file: str = "osm.net.xml",
+    sumo_binary: str = "sumo",
+    green_lmin: float | None = None,
+    green_lmax: float | None = None,
+    sumo_trip_stats: bool = False,
+) -> Dict[str, Any]:
+    """Run one simulation in-process and persist outputs + summary metrics.
+
+    Sweep drivers should call this directly (e.g., from pool workers) instead of
+    spawning `python -m fuzzylts.pipelines.run_experiment`, so interpreter
+    start-up and imports are paid once per process rather than once per run.
 
-    # Configure logging early
-    logging.basicConfig(
-        level=getattr(logging, args.log_level),
-        format="%(asctime)s | %(levelname)-7s | %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    log.setLevel(args.log_level)
+    Args:
+        controller: One of {'static', 'actuated', 'fuzzy', 'gap_fuzzy'}.
+        scenario: Demand scenario (selects `generated_routes_<scenario>.rou.xml`).
+        seed: Random seed for SUMO.
+        net_file: Network file relative to `sumo_files/`.
+        sumo_binary: 'sumo' or 'sumo-gui'.
+        green_lmin: Fuzzy 'green' lower bound override (None = YAML value).
+        green_lmax: Fuzzy 'green' upper bound override (None = YAML value).
+            With any override, the run_id gains a `_green<lmin>-<lmax>` suffix
+            (`cfg` for a bound left as configured), so grid points with the
+            same controller/scenario/seed get their own folder under
+            `experiments/`. Both values are also recorded in `metrics.json`.
+        sumo_trip_stats: Opt in to SUMO's `<vehicleTripStatistics>` means
+            (2-decimal precision by default) instead of the tripinfo pass;
+            falls back to tripinfo when stats.xml lacks them. `metrics.json`
+            records the source used as `metrics_source`.
 
+    Returns:
+        The metrics dictionary written to `metrics.json`.
+
+    Raises:
+        FileNotFoundError: If the network, the routes file or the base `.sumocfg`
+            is missing (raised by `run_sumo_once`).
+        ValueError: If green bounds are given for a non-fuzzy controller, or
+            they are not `lmin < lmax`.
+    """
     # Prepare input files
-    net_file = SUMO_DIR / args.net_file
-    routes_file = SUMO_DIR / f"generated_routes_{args.scenario}.rou.xml"
+    net_path = SUMO_DIR / net_file
+    routes_file = SUMO_DIR / f"generated_routes_{scenario}.rou.xml"
     cfg_file = SUMO_DIR / "osm.sumocfg"
 
-    if not routes_file.exists():
-        log.error("Routes file not found: %s", routes_file)
-        raise FileNotFoundError(routes_file)
-    if not cfg_file.exists():
-        log.error("Config file not found: %s", cfg_file)
-        raise FileNotFoundError(cfg_file)
-    # (Optional) we do not hard-fail if `net_file` is missing; SUMO will error out if invalid.
-
-    # Generate temporary config with overridden routes and seed
-    temp_cfg = override_sumocfg(cfg_file, {"route-files": str(routes_file), "seed": str(args.seed)})
+    # Inputs are validated once, by `run_sumo_once` (no duplicate stat() here)
 
     # Create unique run directory
-    run_id = f"{args.controller}_{args.scenario}_{args.seed:02d}"
+    run_id = f"{controller}_{scenario}_{seed:02d}"
+    if green_lmin is not None or green_lmax is not None:
+        # Same flat layout; `stats._parse_run_folder_name` reads the suffix back
+        run_id += "_green" + "-".join("cfg" if v is None else f"{v:g}" for v in (green_lmin, green_lmax))
     out_dir = EXP_DIR / run_id
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -185,61 +225,145 @@ def main() -> None:
     os.environ["FUZZYLTS_RUN_DIR"] = str(out_dir)
 
     # Execute SUMO + controller
-    trip_xml, stats_xml = run_sumo_once(
-        sumo_binary=args.sumo_binary,
-        controller_name=args.controller,
-        net_xml=net_file,
-        routes_xml=routes_file,
-        sumocfg=temp_cfg,
-        output_dir=out_dir,
-        sim_seed=args.seed,
-    )
-
-    # Clean up temporary config
-    if temp_cfg.name.startswith("_temp_") and temp_cfg.exists():
-        temp_cfg.unlink()
-        log.debug("Removed temp config: %s", temp_cfg)
+    try:
+        trip_xml, stats_xml = run_sumo_once(
+            sumo_binary=sumo_binary,
+            controller_name=controller,
+            net_xml=net_path,
+            routes_xml=routes_file,
+            sumocfg=cfg_file,  # routes and seed go on SUMO's command line
+            output_dir=out_dir,
+            sim_seed=seed,
+            green_lmin=green_lmin,
+            green_lmax=green_lmax,
+        )
+    except FileNotFoundError as e:
+        log.error("Input not found: %s", e)
+        raise
 
     # Post-process metrics
-    df = tripinfo_xml_to_df(trip_xml)
     stats = stats_xml_to_dict(stats_xml)
 
-    # Determine columns present in tripinfo
-    wait_col = "waitingTime" if "waitingTime" in df.columns else "waiting_time"
-    speed_col = "speed"
-
-    # Compute average speed with fallbacks
-    if speed_col in df.columns:
-        avg_speed = df[speed_col].mean()
-    elif {"routeLength", "duration"}.issubset(df.columns):
-        avg_speed = (df["routeLength"] / df["duration"]).mean()
+    if sumo_trip_stats and all(f"vehicleTripStatistics_{k}" in stats for k in _TRIP_STATS_KEYS) \
+            and stats["vehicleTripStatistics_count"] > 0:
+        # Opt-in: SUMO already averaged the finished trips, tripinfo is not parsed
+        metrics_source = "statistics"
+        n_trips = int(stats["vehicleTripStatistics_count"])
+        avg_wait = stats["vehicleTripStatistics_waitingTime"]
+        avg_duration = stats["vehicleTripStatistics_duration"]
+        avg_speed = stats["vehicleTripStatistics_speed"]  # mean routeLength / duration
+        last_time = stats.get("performance_end", 0)
     else:
-        avg_speed = None
+        # Default: aggregate tripinfo in one streaming pass
+        metrics_source = "tripinfo"
+        trips = summarize_tripinfo(trip_xml)
+        n_trips = trips["trips"]
+
+        # Waiting time: SUMO's `waitingTime`, else the legacy `waiting_time`
+        avg_wait = trips["mean_waitingTime"]
+        if avg_wait is None:
+            avg_wait = trips["mean_waiting_time"]
+        avg_duration = trips["mean_duration"]
+
+        # Compute average speed with fallbacks (speed, else routeLength / duration)
+        avg_speed = trips["mean_speed"]
+        if avg_speed is None:
+            avg_speed = trips["mean_route_speed"]
+        last_time = trips["max_arrival"] if trips["max_arrival"] is not None else 0
 
     # Determine simulation end time (multiple fallbacks)
-    sim_time = (
-        stats.get("time")
-        or stats.get("end")
-        or stats.get("step")
-        or (df["arrival"].max() if "arrival" in df.columns else 0)
-    )
+    sim_time = stats.get("time") or stats.get("end") or stats.get("step") or last_time
 
     metrics = {
-        "avg_wait": df[wait_col].mean() if wait_col in df.columns else None,
-        "avg_duration": df["duration"].mean() if "duration" in df.columns else None,
+        "avg_wait": avg_wait,
+        "avg_duration": avg_duration,
         "avg_speed": avg_speed,
-        "vehicles": len(df),
-        "inserted": stats.get("inserted", len(df)),
-        "ended": stats.get("ended", len(df)),
+        "vehicles": n_trips,
+        "inserted": stats.get("inserted", n_trips),
+        "ended": stats.get("ended", n_trips),
         "teleports": stats.get("teleports_total", 0),
         "sim_time": sim_time,
+        "green_lmin": green_lmin,
+        "green_lmax": green_lmax,
+        "metrics_source": metrics_source,
+    }
+
+    # Same keys (and order) as the CLI namespace, for downstream compatibility
+    run_config = {
+        "controller": controller,
+        "sumo_binary": sumo_binary,
+        "scenario": scenario,
+        "net_file": net_file,
+        "seed": seed,
+        "green_lmin": green_lmin,
+        "green_lmax": green_lmax,
+        "sumo_trip_stats": sumo_trip_stats,
+        "log_level": logging.getLevelName(log.getEffectiveLevel()),
     }
 
     # Persist outputs
-    (out_dir / "metrics.json").write_text(json.dumps(metrics, indent=2))
-    (out_dir / "config.json").write_text(json.dumps(vars(args), indent=2))
+    _write_json_atomic(out_dir / "metrics.json", metrics)
+    _write_json_atomic(out_dir / "config.json", run_config)
 
     log.info("Experiment completed: %s", run_id)
+    return metrics
+
+
+def run_one(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run one simulation described by a `parse_args()` namespace.
+
+    Returns:
+        The metrics dictionary written to `metrics.json`.
+    """
+    log.setLevel(args.log_level)
+    return run(
+        controller=args.controller,
+        scenario=args.scenario,
+        seed=args.seed,
+        net_file=args.net_file,
+        sumo_binary=args.sumo_binary,
+        green_lmin=args.green_lmin,
+        green_lmax=args.green_lmax,
+        sumo_trip_stats=args.sumo_trip_stats,
+    )
+
+
+def run_sweep(configs: List[argparse.Namespace], workers: int | None = None) -> List[Dict[str, Any]]:
+    """Run many independent simulations over a process pool.
+
+    Each SUMO run is single-threaded, so (controller, scenario, seed) points are
+    spread one per process. Workers are started via `forkserver` where available
+    (`spawn` otherwise): they never inherit a parent's TraCI connection or
+    controller state, and imports are paid once per worker, not once per run.
+
+    Args:
+        configs: Namespaces as returned by `parse_args(...)`.
+        workers: Pool size (default: CPU count).
+
+    Returns:
+        Metrics dictionaries, in the order of `configs`.
+    """
+    method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context(method)) as ex:
+        return list(ex.map(run_one, configs))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Main
+# ─────────────────────────────────────────────────────────────────────────────
+def main() -> None:
+    """Run one simulation and persist outputs + summary metrics."""
+    args = parse_args()
+
+    # Configure logging early (once; a driver may already have set handlers)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, args.log_level),
+            format="%(asctime)s | %(levelname)-7s | %(name)s: %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+    run_one(args)
 
 
 if __name__ == "__main__":
@@ -32,10 +32,12 @@ import argparse
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from shutil import which
-from typing import Final, Dict, List
+from typing import Final, Dict, List, Tuple
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tunables (adjust as needed)
@@ -70,8 +72,9 @@ OUT_DIR_DEFAULT: Final[str] = "routes"
 # sumolib loader
 # ─────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def _load_sumolib():
-    """Return `sumolib.net.readNet`, attempting `$SUMO_HOME/tools` if needed."""
+    """Return `sumolib.net.readNet`, attempting `$SUMO_HOME/tools` if needed (memoized)."""
     try:
         from sumolib.net import readNet  # type: ignore
         return readNet
@@ -92,8 +95,9 @@ def _load_sumolib():
             raise RuntimeError(f"Failed to import sumolib from {tools}: {e}")
 
 
-def _resolve_randomtrips() -> List[str]:
-    """Resolve the randomTrips.py invocation `[python, randomTrips.py]`."""
+@lru_cache(maxsize=1)
+def _resolve_randomtrips() -> Tuple[str, str]:
+    """Resolve the randomTrips.py invocation `(python, randomTrips.py)` (memoized)."""
     py = sys.executable or "python"
     rt = which("randomTrips.py")
     if not rt:
@@ -103,7 +107,7 @@ def _resolve_randomtrips() -> List[str]:
             rt = str(cand)
     if not rt:
         raise FileNotFoundError("randomTrips.py not found in PATH or $SUMO_HOME/tools")
-    return [py, rt]
+    return (py, rt)
 
 
 def _run(cmd: List[str]) -> None:
@@ -235,14 +239,16 @@ def _plan_for_scenario(stats: NetStats, scenario: str) -> DemandPlan:
 # randomTrips runner
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _build_routes(net: Path, hours: float, out_dir: Path, plan: DemandPlan, seed: int) -> Path:
+def _build_routes(
+    net: Path, hours: float, out_dir: Path, plan: DemandPlan, seed: int, stats: NetStats
+) -> Path:
     """Invoke `randomTrips.py` to generate routes for a single scenario."""
     duration = int(round(hours * 3600))
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"generated_routes_{plan.scenario}.rou.xml"
 
     cmd = (
-        _resolve_randomtrips()
+        list(_resolve_randomtrips())
         + [
             "-n", str(net),
             "-r", str(out_path),
@@ -265,9 +271,9 @@ def _build_routes(net: Path, hours: float, out_dir: Path, plan: DemandPlan, seed
     print(
         "[INFO] "
         f"scenario={plan.scenario} | hours={hours:.2f} | "
-        f"inbound_lanes_eff={stats_cache.inbound_lanes_eff} | "
-        f"cap_per_lane_eff={stats_cache.cap_per_lane_eff:.0f} "
-        f"(base={CAP_PER_LANE_BASE}, signal_factor={stats_cache.signal_factor:.2f}) | "
+        f"inbound_lanes_eff={stats.inbound_lanes_eff} | "
+        f"cap_per_lane_eff={stats.cap_per_lane_eff:.0f} "
+        f"(base={CAP_PER_LANE_BASE}, signal_factor={stats.signal_factor:.2f}) | "
         f"v/c_applied={plan.vc_applied:.2f} | target_hour={plan.target_hour} | "
         f"period={plan.period_s:.3f}s | rate={plan.veh_per_sec:.2f} veh/s | trips={trips_total}"
     )
@@ -295,33 +301,37 @@ def parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
-# Simple module-level cache for logging (set in main()).
-stats_cache: NetStats  # assigned in main()
-
-
 def main() -> None:
     """CLI entry point."""
-    global stats_cache
     args = parse_args()
 
     if not args.net.exists():
         raise FileNotFoundError(f"Network not found: {args.net}")
 
-    stats_cache = _estimate_net_stats(args.net)
+    stats = _estimate_net_stats(args.net)
     scenarios = list(SCENARIO_VC.keys()) if args.scenario == "all" else [args.scenario]
 
     print(
         "[NET] "
-        f"inbound_lanes_eff={stats_cache.inbound_lanes_eff} | "
-        f"signal_factor={stats_cache.signal_factor:.2f} | "
-        f"cap_per_lane_eff={stats_cache.cap_per_lane_eff:.0f} veh/h/ln "
+        f"inbound_lanes_eff={stats.inbound_lanes_eff} | "
+        f"signal_factor={stats.signal_factor:.2f} | "
+        f"cap_per_lane_eff={stats.cap_per_lane_eff:.0f} veh/h/ln "
         f"(base={CAP_PER_LANE_BASE})"
     )
 
-    for sc in scenarios:
-        plan = _plan_for_scenario(stats_cache, sc)
-        path = _build_routes(args.net, args.hours, args.out, plan, args.seed)
-        print(f"[OK] {sc:10s}  {path}")
+    _resolve_randomtrips()  # resolve once, fail before the first scenario
+    plans = [_plan_for_scenario(stats, sc) for sc in scenarios]
+
+    # Scenarios are independent randomTrips.py child processes; threads only
+    # wait on them, so all run concurrently (up to the CPU count).
+    workers = min(len(plans), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {
+            ex.submit(_build_routes, args.net, args.hours, args.out, plan, args.seed, stats): plan.scenario
+            for plan in plans
+        }
+        for f in as_completed(futures):
+            print(f"[OK] {futures[f]:10s}  {f.result()}")
 
 
 if __name__ == "__main__":
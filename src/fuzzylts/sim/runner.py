@@ -13,7 +13,8 @@ Pipeline
 2) Expose the network path to controllers via `TARGET_NET_XML` env var.
 3) Lazily load the requested controller module (see `fuzzylts.controllers`).
 4) Optionally preprocess the network (controller-specific, idempotent).
-5) Start SUMO with CLI overrides for outputs and reproducibility.
+5) Start SUMO with CLI overrides for outputs and reproducibility, and
+   subscribe every TLS to its phase/state (plus controller-declared extras).
 6) In the main loop:
    - Let the controller compute a (possibly new) phase duration.
    - For fuzzy controllers, apply the duration **only when entering green**.
@@ -26,21 +27,27 @@ A tuple `(tripinfo_xml, stats_xml)` with paths inside the provided output dir.
 
 from __future__ import annotations
 
+import logging
 import os
 from pathlib import Path
 from shutil import which
 from typing import Tuple
 
-import traci
+import traci.constants as tc
 
 from fuzzylts.controllers import get_controller  # lazy loader returns module
 from fuzzylts.utils.log import get_logger
+from fuzzylts.utils.traci_backend import USING_LIBSUMO, traci
 
 log = get_logger(__name__)
 
 # Controllers read the network from this environment variable for reproducibility
 _TARGET_NET_ENV = "TARGET_NET_XML"
 
+# TLS variables read every step (by the loop below and the fuzzy controllers).
+# Controllers may append their own via a module-level `TLS_SUBSCRIPTION_VARS`.
+_TLS_SUBSCRIPTION_VARS = (tc.TL_CURRENT_PHASE, tc.TL_RED_YELLOW_GREEN_STATE)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Utilities
@@ -85,7 +92,7 @@ def _ensure_file(path: Path, label: str) -> None:
 
 def _phase_is_green(state: str) -> bool:
     """Heuristic: treat any 'g' or 'G' in the state string as a green phase."""
-    return any(c in "gG" for c in state)
+    return "G" in state or "g" in state  # C-level substring checks, no generator
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -101,6 +108,8 @@ def run_sumo_once(
     output_dir: Path,
     sim_seed: int = 0,
     step_length: float = 1.0,
+    green_lmin: float | None = None,
+    green_lmax: float | None = None,
 ) -> Tuple[Path, Path]:
     """Execute a single SUMO simulation and return the main output files.
 
@@ -122,16 +131,25 @@ def run_sumo_once(
         Random seed for reproducibility.
     step_length : float
         Simulation step length in seconds.
+    green_lmin, green_lmax : float | None
+        Fuzzy 'green' bounds for this run (None = configured value); passed to
+        the controller's `initialize_tls`. Fuzzy-family controllers only.
 
     Returns
     -------
     (tripinfo_xml, stats_xml) : tuple[Path, Path]
     """
     # Validate inputs early
+    is_fuzzy = controller_name in {"fuzzy", "gap_fuzzy"}
+    green_bounds = {"green_lmin": green_lmin, "green_lmax": green_lmax}
+    if not is_fuzzy and (green_lmin is not None or green_lmax is not None):
+        raise ValueError(f"Green bounds only apply to fuzzy controllers, not '{controller_name}'.")
     _ensure_file(net_xml, "Network XML")
     _ensure_file(routes_xml, "Routes XML")
     _ensure_file(sumocfg, "SUMO config")
     sumo_exec = _resolve_sumo_binary(sumo_binary)
+    if USING_LIBSUMO and Path(sumo_exec).stem == "sumo-gui":
+        raise ValueError("libsumo cannot drive sumo-gui; unset FUZZYLTS_USE_LIBSUMO to use the GUI.")
 
     # Prepare outputs
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -192,7 +210,8 @@ def run_sumo_once(
     ]
 
     log.info("Starting SUMO (%s) with controller=%s", sumo_binary, controller_name)
-    log.debug("Command: %s", " ".join(sumo_cmd))
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Command: %s", " ".join(sumo_cmd))
 
     # Start simulation
     traci.start(sumo_cmd)
@@ -200,11 +219,21 @@ def run_sumo_once(
     try:
         # TLS bootstrap
         tls_ids = list(traci.trafficlight.getIDList())
-        is_fuzzy = controller_name in {"fuzzy", "gap_fuzzy"}
-        controller.initialize_tls()
+        if is_fuzzy:
+            controller.initialize_tls(**green_bounds)
+        else:
+            controller.initialize_tls()
+
+        # One subscription per TLS: SUMO pushes phase/state with every step, so
+        # per-step reads are local dict lookups instead of socket round-trips.
+        # SUMO keeps a single variable list per object, hence the merge here.
+        tls_vars = _TLS_SUBSCRIPTION_VARS + tuple(getattr(controller, "TLS_SUBSCRIPTION_VARS", ()))
+        for tls in tls_ids:
+            traci.trafficlight.subscribe(tls, tls_vars)
 
         # Track previous phase to detect green entries
-        prev_phase = {tls: traci.trafficlight.getPhase(tls) for tls in tls_ids}
+        tls_results = traci.trafficlight.getAllSubscriptionResults()
+        prev_phase = {tls: tls_results[tls][tc.TL_CURRENT_PHASE] for tls in tls_ids}
 
         # Main loop
         while traci.simulation.getMinExpectedNumber() > 0:
@@ -212,9 +241,13 @@ def run_sumo_once(
             # while traci.simulation.getTime() < 3600 * 4:
             traci.simulationStep()
 
+            # All TLS subscription results for this step, fetched once.
+            tls_results = traci.trafficlight.getAllSubscriptionResults()
+
             for tls in tls_ids:
-                current_phase = traci.trafficlight.getPhase(tls)
-                current_state = traci.trafficlight.getRedYellowGreenState(tls)
+                res = tls_results[tls]
+                current_phase = res[tc.TL_CURRENT_PHASE]
+                current_state = res[tc.TL_RED_YELLOW_GREEN_STATE]
 
                 # Always let the controller compute (and possibly log) the duration
                 green_duration = controller.get_phase_duration(tls)
@@ -34,19 +34,26 @@ Overall ~O(E + C), where `E` = number of edges/lanes, `C` = connections.
 
 Notes
 -----
-- This module uses only Python stdlib and a small project helper to load XML.
+- The network is stream-parsed (`parse_network_stream`) with lxml when it is
+  installed, falling back to the stdlib `iterparse`.
 - XML structure assumed per SUMO's `net_file.xsd`.
+- Results are memoized per process on `(resolved path, mtime, max_depth,
+  stop_at_tl)`, and the parsed connection graph is shared across depths, so
+  loading several controller configs parses the network only once. Callers
+  always receive a private deep copy.
 """
 
 from __future__ import annotations
 
+import copy
 from collections import defaultdict, deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Deque, Dict, Final, List, Set, Tuple
 
 import xml.etree.ElementTree as ET
 
-from fuzzylts.utils.io import load_xml_root  # type: ignore
+from fuzzylts.utils.io import iter_elements
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Constants & type aliases
@@ -65,6 +72,15 @@ Link = Tuple[int, str, int, str]
 # Reverse-graph item: (fromEdge, dir, tl_id_or_empty)
 UpstreamItem = Tuple[str, str, str]
 
+# Parsed network lookup tables:
+#   (edge_lanes, tl_links, upstream_of, tl_programs)
+NetworkGraph = Tuple[
+    Dict[str, List[str]],
+    Dict[str, List[Link]],
+    Dict[str, Set[UpstreamItem]],
+    Dict[str, List[str]],
+]
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
@@ -120,28 +136,7 @@ def build_connections(
     upstream_of: Dict[str, Set[UpstreamItem]] = defaultdict(set)
 
     for conn in root.findall("connection"):
-        f = conn.get("from")
-        t = conn.get("to")
-        if not f or not t:
-            continue
-
-        d = conn.get("dir", "")  # direction: 's', 'l', 'r', ...
-        tl = conn.get("tl", "")  # TL id (may be empty when not TL-controlled)
-
-        upstream_of[t].add((f, d, tl))
-
-        tl_id = conn.get("tl")
-        if tl_id is not None:
-            # Record TL-controlled links with stable ordering by linkIndex.
-            try:
-                link_idx = int(conn.get("linkIndex", "-1"))
-            except ValueError:
-                link_idx = -1
-            try:
-                from_lane_idx = int(conn.get("fromLane", "0"))
-            except ValueError:
-                from_lane_idx = 0
-            tl_links[tl_id].append((link_idx, f, from_lane_idx, t))
+        _record_connection(conn, tl_links, upstream_of)
 
     # Ensure deterministic ordering by linkIndex for each TL.
     for tl_id in tl_links:
@@ -150,6 +145,36 @@ def build_connections(
     return tl_links, upstream_of
 
 
+def _record_connection(
+    conn: ET.Element,
+    tl_links: Dict[str, List[Link]],
+    upstream_of: Dict[str, Set[UpstreamItem]],
+) -> None:
+    """Add one `<connection>` element to the link table and reverse graph."""
+    f = conn.get("from")
+    t = conn.get("to")
+    if not f or not t:
+        return
+
+    d = conn.get("dir", "")  # direction: 's', 'l', 'r', ...
+    tl = conn.get("tl", "")  # TL id (may be empty when not TL-controlled)
+
+    upstream_of[t].add((f, d, tl))
+
+    tl_id = conn.get("tl")
+    if tl_id is not None:
+        # Record TL-controlled links with stable ordering by linkIndex.
+        try:
+            link_idx = int(conn.get("linkIndex", "-1"))
+        except ValueError:
+            link_idx = -1
+        try:
+            from_lane_idx = int(conn.get("fromLane", "0"))
+        except ValueError:
+            from_lane_idx = 0
+        tl_links[tl_id].append((link_idx, f, from_lane_idx, t))
+
+
 def build_tl_programs(root: ET.Element) -> Dict[str, List[str]]:
     """Build TL programs from `<tlLogic>`, collecting phase `state` strings.
 
@@ -260,11 +285,74 @@ def extract_phase_lanes(
     - Internal edges (IDs starting with `':'`) are excluded from the result.
     - If your network includes pedestrian/bicycle lanes and you want to exclude
       them, filter by edge type or lane permissions in `build_edge_lanes()`.
+    - Results are cached in-process; the returned mapping is a deep copy and
+      may be mutated freely by the caller.
     """
-    root = load_xml_root(path=str(net_path))
-    edge_lanes = build_edge_lanes(root)
-    tl_links, upstream_of = build_connections(root)
-    tl_programs = build_tl_programs(root)
+    net = Path(net_path).resolve()
+    cached = _compute_phase_lanes(str(net), net.stat().st_mtime_ns, max_depth, stop_at_tl)
+    return copy.deepcopy(cached)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Memoized internals
+# ─────────────────────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=8)
+def _network_graph(net_path: str, mtime_ns: int) -> NetworkGraph:
+    """Parse the network once and keep only the derived lookup tables.
+
+    `mtime_ns` only participates in the cache key so edits invalidate it.
+    The XML is streamed, so the full tree is never materialized.
+    """
+    return parse_network_stream(net_path)
+
+
+def parse_network_stream(net_path: str | Path) -> NetworkGraph:
+    """Stream-parse a SUMO net into the lookup tables used by the extractor.
+
+    Equivalent to running `build_edge_lanes`, `build_connections` and
+    `build_tl_programs` on `fuzzylts.utils.io.load_xml_root(net_path)`, but
+    each top-level element is processed at its end tag and then discarded
+    (`fuzzylts.utils.io.iter_elements`), so the full DOM is never held in memory.
+
+    Returns
+    -------
+    NetworkGraph
+        `(edge_lanes, tl_links, upstream_of, tl_programs)`.
+    """
+    edge_lanes: Dict[str, List[str]] = {}
+    tl_links: Dict[str, List[Link]] = defaultdict(list)
+    upstream_of: Dict[str, Set[UpstreamItem]] = defaultdict(set)
+    tl_programs: Dict[str, List[str]] = {}
+
+    for elem in iter_elements(net_path, ("edge", "connection", "tlLogic")):
+        tag = elem.tag
+        if tag == "edge":
+            eid = elem.get("id")
+            if eid:
+                edge_lanes[eid] = [ln.get("id") for ln in elem.findall("lane") if ln.get("id")]
+        elif tag == "connection":
+            _record_connection(elem, tl_links, upstream_of)
+        else:  # tlLogic
+            tid = elem.get("id")
+            if tid:
+                tl_programs[tid] = [ph.get("state", "") for ph in elem.findall("phase")]
+
+    for tl_id in tl_links:
+        tl_links[tl_id].sort(key=lambda x: x[0])
+
+    return edge_lanes, tl_links, upstream_of, tl_programs
+
+
+@lru_cache(maxsize=8)
+def _compute_phase_lanes(
+    net_path: str,
+    mtime_ns: int,
+    max_depth: int,
+    stop_at_tl: bool,
+) -> Dict[str, Dict[int, List[str]]]:
+    """Memoized body of `extract_phase_lanes()` (`mtime_ns` only keys the cache)."""
+    edge_lanes, tl_links, upstream_of, tl_programs = _network_graph(net_path, mtime_ns)
 
     result: Dict[str, Dict[int, List[str]]] = {}
 
@@ -319,5 +407,6 @@ __all__ = [
     "build_edge_lanes",
     "build_connections",
     "build_tl_programs",
+    "parse_network_stream",
     "collect_upstream_edges_by_street",
 ]
@@ -30,11 +30,14 @@ Typical usage
     rules = build_rules(cfg.rules, vars_["vehicles"], vars_["arrival"], vars_["green"])
     system = ctrl.ControlSystem(rules)
     sim = ctrl.ControlSystemSimulation(system)
+
+    # Or evaluate the same Mamdani system over a whole input grid at once:
+    table = green_surface(vars_, cfg.rules, vehicles=[4, 5, 6], rates=[0.0, 0.5, 1.0])
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, MutableMapping, Sequence, Union
+from typing import Dict, List, Mapping, MutableMapping, Sequence, Tuple, Union
 
 import numpy as np
 import skfuzzy as fuzz
@@ -142,4 +145,155 @@ def build_rules(
     return rules
 
 
-__all__ = ["generate_memberships", "build_rules", "FuzzyVar"]
+def rules_to_arrays(
+    rule_list: Sequence[Sequence[str]],
+    memberships: Mapping[str, FuzzyVar],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Encode the rule base as three parallel level-index arrays.
+
+    Each triplet `[vehicles_level, arrival_level, green_level]` becomes one
+    position in `(veh_idx, arr_idx, out_idx)`, where an index is the label's
+    position in the variable's level order (as created by
+    `generate_memberships`).
+
+    Args:
+        rule_list: Triplets `[vehicles_level, arrival_level, green_level]`.
+        memberships: Variables from `generate_memberships`.
+
+    Returns:
+        `(veh_idx, arr_idx, out_idx)` as `int8` arrays of length `len(rule_list)`.
+
+    Raises:
+        KeyError: If a rule references an unknown level label.
+    """
+    columns = []
+    for col, name in enumerate(("vehicles", "arrival", "green")):
+        index = {label: i for i, label in enumerate(memberships[name].terms)}
+        try:
+            columns.append(np.array([index[rule[col]] for rule in rule_list], dtype=np.int8))
+        except KeyError as e:
+            raise KeyError(f"Unknown '{name}' level {e.args[0]!r} in rule base.") from None
+    return columns[0], columns[1], columns[2]
+
+
+def _cut_crossings(universe: np.ndarray, mf: np.ndarray, cuts: np.ndarray) -> np.ndarray:
+    """Universe points where `mf` crosses each cut level (vectorized over cuts).
+
+    Row-wise equivalent of scikit-fuzzy's `_interp_universe_fast`: returns an
+    array of shape `(len(cuts), k)`, padded with `universe[0]` (already part of
+    the universe, so padding adds no new sample points).
+    """
+    peak = int(np.argmax(mf))
+    rise, fall = mf[: peak + 1], mf[peak:]
+    if np.all(np.diff(rise) >= 0) and np.all(np.diff(fall) <= 0):
+        # Unimodal MF (all of ours): {mf >= cut} is one index run [lo, hi], so
+        # its two edges come from binary searches instead of a full scan.
+        # A zero cut compares strictly (mf > 0), as scikit-fuzzy does.
+        zero = cuts == 0.0
+        lo = np.where(zero, np.searchsorted(rise, 0.0, "right"), np.searchsorted(rise, cuts, "left"))
+        hi = peak - 1 + np.where(zero, np.searchsorted(-fall, 0.0, "left"), np.searchsorted(-fall, -cuts, "right"))
+        hit = lo <= hi
+        rows = np.concatenate([np.nonzero(hit & (lo > 0))[0], np.nonzero(hit & (hi < len(mf) - 1))[0]])
+        idx = np.concatenate([lo[hit & (lo > 0)] - 1, hi[hit & (hi < len(mf) - 1)]])
+        order = np.argsort(rows, kind="stable")
+        rows, idx = rows[order], idx[order]
+    else:
+        above = mf[None, :] >= cuts[:, None]
+        zero = cuts == 0.0
+        if zero.any():  # a zero cut matches everywhere; compare strictly instead
+            above[zero] = mf > 0.0
+        rows, idx = np.nonzero(above[:, 1:] != above[:, :-1])
+    xx = universe[idx] + (cuts[rows] - mf[idx]) * (universe[idx + 1] - universe[idx]) / (mf[idx + 1] - mf[idx])
+
+    counts = np.bincount(rows, minlength=len(cuts))
+    out = np.full((len(cuts), int(counts.max(initial=0))), universe[0])
+    starts = np.cumsum(counts) - counts
+    out[rows, np.arange(len(rows)) - starts[rows]] = xx
+    return out
+
+
+def green_surface(
+    memberships: Mapping[str, FuzzyVar],
+    rule_list: Sequence[Sequence[str]],
+    vehicles: Sequence[float],
+    rates: Sequence[float],
+) -> np.ndarray:
+    """Evaluate the Mamdani system on a `vehicles × rates` grid with NumPy.
+
+    Reproduces `ControlSystemSimulation.compute()` for the rule base produced by
+    `build_rules` (AND = min, accumulation = max, implication = min, centroid
+    defuzzification on the cut-upsampled universe), but for every rate of a
+    vehicles row at once instead of one crisp input pair per call.
+
+    Tolerance: matches scikit-fuzzy to within 1e-9 s (float round-off) at the
+    same crisp inputs; `tests/test_fuzzy_lut.py` checks this on a grid.
+
+    Args:
+        memberships: Variables from `generate_memberships` ("vehicles",
+            "arrival", "green").
+        rule_list: Triplets `[vehicles_level, arrival_level, green_level]`.
+        vehicles: Crisp vehicle counts (clipped to the universe).
+        rates: Crisp arrival rates (clipped to the universe).
+
+    Returns:
+        Array of shape `(len(vehicles), len(rates))` with the defuzzified green
+        time; NaN where no rule fires (scikit-fuzzy raises in that case).
+
+    Raises:
+        KeyError: If a rule references an unknown level label.
+    """
+    veh_idx, arr_idx, out_idx = rules_to_arrays(rule_list, memberships)
+
+    def _fuzzify(var: FuzzyVar, values: Sequence[float]) -> np.ndarray:
+        """Membership of each value in each level → shape (levels, len(values))."""
+        x = np.clip(np.asarray(values, dtype=np.float64), var.universe[0], var.universe[-1])
+        return np.stack([np.interp(x, var.universe, term.mf) for term in var.terms.values()])
+
+    mu_veh = _fuzzify(memberships["vehicles"], vehicles)
+    mu_arr = _fuzzify(memberships["arrival"], rates)
+    grn_var = memberships["green"]
+    universe = np.asarray(grn_var.universe, dtype=np.float64)
+    out_mfs = np.stack([np.asarray(term.mf, dtype=np.float64) for term in grn_var.terms.values()])
+    fired = np.unique(out_idx)  # output terms without rules are skipped, as in scikit-fuzzy
+
+    surface = np.empty((len(vehicles), len(rates)))
+    for i in range(surface.shape[0]):
+        # Activation (cut level) of each output term for every rate of this row
+        strength = np.minimum(mu_veh[veh_idx, i][:, None], mu_arr[arr_idx])
+        cuts = {int(t): strength[out_idx == t].max(axis=0) for t in fired}
+
+        # Upsample the universe at the cut crossings and aggregate the clipped
+        # terms: on universe points the term MFs are known, so only the inserted
+        # points need interpolating.
+        extra = np.concatenate([_cut_crossings(universe, out_mfs[t], cut) for t, cut in cuts.items()], axis=1)
+        y_base = np.zeros((len(rates), len(universe)))
+        y_extra = np.zeros_like(extra)
+        for t, cut in cuts.items():
+            np.maximum(y_base, np.minimum(cut[:, None], out_mfs[t][None, :]), out=y_base)
+            np.maximum(y_extra, np.minimum(cut[:, None], np.interp(extra, universe, out_mfs[t])), out=y_extra)
+
+        # Merge: inserted point k of a row lands after every universe point
+        # <= it, shifted by the k inserted points before it.
+        order = np.argsort(extra, axis=1)
+        extra = np.take_along_axis(extra, order, axis=1)
+        y_extra = np.take_along_axis(y_extra, order, axis=1)
+        dest = np.searchsorted(universe, extra, side="right") + np.arange(extra.shape[1])
+        is_extra = np.zeros((len(rates), len(universe) + extra.shape[1]), dtype=bool)
+        np.put_along_axis(is_extra, dest, True, axis=1)
+        x = np.empty(is_extra.shape)
+        y = np.empty(is_extra.shape)
+        x[is_extra], y[is_extra] = extra.ravel(), y_extra.ravel()
+        x[~is_extra], y[~is_extra] = np.broadcast_to(universe, y_base.shape).ravel(), y_base.ravel()
+
+        # Exact centroid of the piecewise-linear aggregate (trapezoid per segment)
+        dx = np.diff(x, axis=1)
+        y1, y2 = y[:, :-1], y[:, 1:]
+        area = 0.5 * dx * (y1 + y2)
+        moment = area * x[:, :-1] + dx * dx * (y1 + 2.0 * y2) / 6.0
+        total = area.sum(axis=1)
+        surface[i] = np.where(y.sum(axis=1) == 0.0, np.nan, moment.sum(axis=1) / np.fmax(total, np.finfo(float).eps))
+
+    return surface
+
+
+__all__ = ["generate_memberships", "build_rules", "rules_to_arrays", "green_surface", "FuzzyVar"]
@@ -6,7 +6,10 @@ I/O utilities for SUMO outputs and network XMLs.
 
 This module provides:
 - `load_xml_root`: transparent loading of plain `.xml` or gzip-compressed `.xml.gz`.
-- `tripinfo_xml_to_df`: robust parser for `tripinfo.xml` into a typed `pandas.DataFrame`.
+- `iter_elements`: streaming iteration over the top-level elements of such a file.
+- `tripinfo_xml_to_arrays`: robust parser for `tripinfo.xml` into NumPy columns.
+- `tripinfo_xml_to_df`: the same columns as a typed `pandas.DataFrame`.
+- `summarize_tripinfo`: single-pass per-run aggregates of `tripinfo.xml` (no DataFrame).
 - `stats_xml_to_dict`: permissive parser for `statistics.xml` into a numeric dict.
 
 Notes
@@ -18,12 +21,25 @@ Notes
 from __future__ import annotations
 
 import gzip
+import math
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 
+# Prefer libxml2-backed lxml for streaming large outputs (tripinfo); fall back
+# to the stdlib parser when it is not installed.
+try:
+    from lxml import etree as _etree
+
+    _ITERPARSE_KW: Dict[str, bool] = {"huge_tree": True}
+except ImportError:  # pragma: no cover - optional dependency
+    _etree = ET  # type: ignore[assignment]
+    _ITERPARSE_KW = {}
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # XML loader
@@ -53,16 +69,64 @@ def load_xml_root(path: str | Path) -> ET.Element:
     return ET.parse(str(p)).getroot()
 
 
+def iter_elements(path: str | Path, tag: str | Collection[str] | None = None) -> Iterator[Any]:
+    """Stream the top-level elements of a plain or gzipped XML file.
+
+    Yields each direct child of the root whose tag is `tag` (or one of several
+    tags; every child when None) at its end tag, with its subtree complete.
+    Every finished top-level element is cleared once the consumer asks for the
+    next one, so the full DOM is never held: do not keep references across
+    iterations. Uses lxml (libxml2, `huge_tree=True`) when available and the
+    stdlib `iterparse` otherwise.
+
+    Parameters
+    ----------
+    path : str | Path
+        Path to the XML file (optionally gzip-compressed).
+    tag : str | Collection[str] | None
+        Tag name(s) to yield.
+
+    Yields
+    ------
+    Element
+        Top-level elements in document order.
+    """
+    wanted = None if tag is None else frozenset((tag,) if isinstance(tag, str) else tag)
+    p = Path(path)
+    is_gz = p.suffix == ".gz" or "".join(p.suffixes).endswith(".gz")
+    opener = gzip.open if is_gz else open
+
+    with opener(p, "rb") as fh:
+        root = None
+        depth = 0
+        for event, elem in _etree.iterparse(fh, events=("start", "end"), **_ITERPARSE_KW):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1:
+                continue  # nested (<lane>, <emissions>, ...) or the root itself
+
+            if wanted is None or elem.tag in wanted:
+                yield elem
+            root.clear()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
-# tripinfo.xml → DataFrame
+# tripinfo.xml → columns / DataFrame
 # ─────────────────────────────────────────────────────────────────────────────
 
-def tripinfo_xml_to_df(xml_file: Path) -> pd.DataFrame:
-    """Parse `tripinfo.xml` into a DataFrame with best-effort numeric typing.
+def tripinfo_xml_to_arrays(xml_file: Path) -> Dict[str, np.ndarray]:
+    """Parse `tripinfo.xml` into one NumPy array per attribute.
 
     Behavior
     --------
-    - Collects every `<tripinfo ...>` tag's attributes into rows.
+    - Collects every top-level `<tripinfo ...>` tag's attributes into columns
+      (streamed with lxml when available; rows lacking an attribute get None,
+      or NaN in numeric columns).
     - Attempts numeric conversion for frequently used columns:
       `depart`, `arrival`, `duration`, `waitingTime`, `waiting_time`,
       `routeLength`, `speed`. Non-existing columns are ignored.
@@ -74,13 +138,28 @@ def tripinfo_xml_to_df(xml_file: Path) -> pd.DataFrame:
 
     Returns
     -------
-    pandas.DataFrame
-        One row per `<tripinfo>` with columns taken from attributes. Selected
-        columns are coerced to numeric (`errors="coerce"`).
+    Dict[str, numpy.ndarray]
+        Equal-length columns in first-seen attribute order. Selected columns
+        are `float64` (coerced like `errors="coerce"`); the others are `object`
+        arrays of strings.
     """
-    root = load_xml_root(path=xml_file)
-    rows: List[Dict[str, str]] = [tag.attrib for tag in root.findall("tripinfo")]
-    df = pd.DataFrame(rows)
+    # Stream the file column-wise: each finished <tripinfo> appends its
+    # attribute values to per-attribute lists and is then discarded, so
+    # neither the DOM nor per-row dicts are kept.
+    cols: Dict[str, List[Optional[str]]] = {}
+    n = 0
+    for elem in iter_elements(xml_file, "tripinfo"):
+        attrib = elem.attrib
+        for key, value in attrib.items():
+            col = cols.get(key)
+            if col is None:
+                col = cols[key] = [None] * n  # attribute first seen here
+            col.append(value)
+        n += 1
+        if len(attrib) != len(cols):  # pad attributes this row lacks
+            for col in cols.values():
+                if len(col) < n:
+                    col.append(None)
 
     # Convert numeric columns one by one (avoids FutureWarning on mixed dtypes)
     NUMERIC_COLS: Iterable[str] = (
@@ -92,17 +171,198 @@ def tripinfo_xml_to_df(xml_file: Path) -> pd.DataFrame:
         "routeLength",
         "speed",
     )
-    for col in NUMERIC_COLS:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    numeric = set(NUMERIC_COLS)
+    arrays: Dict[str, np.ndarray] = {}
+    for key, values in cols.items():
+        if key not in numeric:
+            arr = np.empty(n, dtype=object)
+            arr[:] = values
+            arrays[key] = arr
+            continue
+        try:
+            arrays[key] = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):  # missing or non-numeric values
+            arrays[key] = pd.to_numeric(
+                pd.Series(values, dtype=object), errors="coerce"
+            ).to_numpy(dtype=np.float64, na_value=np.nan)
+    return arrays
+
 
-    return df
+def tripinfo_xml_to_df(xml_file: Path) -> pd.DataFrame:
+    """Parse `tripinfo.xml` into a DataFrame with best-effort numeric typing.
+
+    Thin wrapper over `tripinfo_xml_to_arrays` (same columns and dtypes).
+
+    Parameters
+    ----------
+    xml_file : Path
+        Path to `tripinfo.xml` (plain or gzipped).
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per `<tripinfo>` with columns taken from attributes. Selected
+        columns are coerced to numeric (`errors="coerce"`).
+    """
+    arrays = tripinfo_xml_to_arrays(xml_file)
+    n = len(next(iter(arrays.values()))) if arrays else 0
+    return pd.DataFrame(arrays, index=pd.RangeIndex(n))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# tripinfo.xml → summary (single pass)
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Attributes averaged by `summarize_tripinfo` (output key: `mean_<attr>`)
+_TRIP_MEAN_ATTRS = ("waitingTime", "waiting_time", "duration", "speed")
+
+
+def _to_float(value: str | None) -> float:
+    """`float(value)`, or NaN when missing/non-numeric (like `errors="coerce"`)."""
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def summarize_tripinfo(xml_file: Path) -> Dict[str, float | int | None]:
+    """Aggregate `tripinfo.xml` in one streaming pass, without a DataFrame.
+
+    Matches the pandas reductions on `tripinfo_xml_to_df(xml_file)` (NaNs are
+    skipped; a column with no numeric value averages to NaN; an attribute that
+    no row has yields `None`, as a missing column would).
+
+    Parameters
+    ----------
+    xml_file : Path
+        Path to `tripinfo.xml` (plain or gzipped).
+
+    Returns
+    -------
+    Dict[str, float | int | None]
+        - `trips`: number of top-level `<tripinfo>` rows.
+        - `mean_waitingTime`, `mean_waiting_time`, `mean_duration`, `mean_speed`.
+        - `mean_route_speed`: mean of `routeLength / duration` per trip.
+        - `max_arrival`: latest `arrival`.
+    """
+    nan = float("nan")
+    sums = dict.fromkeys(_TRIP_MEAN_ATTRS, 0.0)
+    counts = dict.fromkeys(_TRIP_MEAN_ATTRS, 0)
+    seen = set()
+    route_sum, route_n = 0.0, 0
+    max_arrival: float | None = None
+    n = 0
+
+    for elem in iter_elements(xml_file, "tripinfo"):
+        attrib = elem.attrib
+        n += 1
+        for key in _TRIP_MEAN_ATTRS:
+            raw = attrib.get(key)
+            if raw is None:
+                continue
+            seen.add(key)
+            value = _to_float(raw)
+            if value == value:  # not NaN
+                sums[key] += value
+                counts[key] += 1
+
+        rl, du = attrib.get("routeLength"), attrib.get("duration")
+        if rl is not None:
+            seen.add("routeLength")
+            rl_f, du_f = _to_float(rl), _to_float(du)
+            if du_f:
+                q = rl_f / du_f
+            else:  # IEEE division, as pandas does (x/0 → ±inf, 0/0 → NaN)
+                q = nan if rl_f == 0 or rl_f != rl_f else math.copysign(math.inf, rl_f)
+            if q == q:
+                route_sum += q
+                route_n += 1
+
+        raw = attrib.get("arrival")
+        if raw is not None:
+            value = _to_float(raw)
+            if max_arrival is None:
+                max_arrival = nan
+            if value == value and not max_arrival >= value:
+                max_arrival = value
+
+    summary: Dict[str, float | int | None] = {"trips": n}
+    for key in _TRIP_MEAN_ATTRS:
+        summary[f"mean_{key}"] = (sums[key] / counts[key] if counts[key] else nan) if key in seen else None
+    summary["mean_route_speed"] = (
+        (route_sum / route_n if route_n else nan) if {"routeLength", "duration"} <= seen else None
+    )
+    summary["max_arrival"] = max_arrival
+    return summary
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # statistics.xml → Dict[str, float]
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Narrow byte-level scanner for the small statistics file. SUMO output files
+# start with a comment holding the full option set, so comments are dropped
+# before looking for tags.
+_RE_XML_COMMENT = re.compile(rb"<!--.*?-->", re.S)
+_RE_XML_TAG = re.compile(rb"<([A-Za-z_][\w.:-]*)([^>]*?)(/?)>")
+_RE_XML_ATTR = re.compile(rb"""([\w.:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+
+
+def _is_number(s: str | None) -> bool:
+    try:
+        float(s)  # type: ignore[arg-type]
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _tag_attrs(raw: bytes) -> Dict[str, str]:
+    """Attributes of a start tag's raw attribute bytes."""
+    return {
+        k.decode(): (dq or sq).decode("utf-8", "replace")  # one quote style matched
+        for k, dq, sq in _RE_XML_ATTR.findall(raw)
+    }
+
+
+# Sections whose numeric attributes are copied as `<tag>_<attr>` (first match)
+_STATS_SECTIONS = ("vehicleTripStatistics", "performance")
+
+
+def _stats_from_parts(
+    root_attrs: Dict[str, str],
+    tele_attrs: Dict[str, str] | None,
+    tele_text: str | None,
+    step_attrs: Dict[str, str] | None,
+    sections: Dict[str, Dict[str, str]],
+) -> Dict[str, float]:
+    """Assemble the `stats_xml_to_dict` result from the few elements it reads."""
+    # Numeric root attributes
+    attrs: Dict[str, float] = {k: float(v) for k, v in root_attrs.items() if _is_number(v)}
+
+    # Teleports (as root attribute)
+    if _is_number(root_attrs.get("teleports")):
+        attrs["teleports_total"] = float(root_attrs["teleports"])
+
+    # Teleports (as sub-tag, by attribute or text)
+    if tele_attrs is not None:
+        if _is_number(tele_attrs.get("count")):
+            attrs["teleports_total"] = float(tele_attrs["count"])
+        elif tele_text and _is_number(tele_text.strip()):
+            attrs["teleports_total"] = float(tele_text.strip())
+
+    # Last step time (if present)
+    if step_attrs is not None and _is_number(step_attrs.get("time")):
+        attrs["step"] = float(step_attrs["time"])
+
+    # SUMO's own aggregates (e.g. `vehicleTripStatistics_waitingTime`)
+    for tag, sec_attrs in sections.items():
+        for k, v in sec_attrs.items():
+            if _is_number(v):
+                attrs[f"{tag}_{k}"] = float(v)
+
+    return attrs
+
+
 def stats_xml_to_dict(xml_file: Path) -> Dict[str, float]:
     """Parse `statistics.xml` into a numeric dictionary (permissive).
 
@@ -113,7 +373,13 @@ def stats_xml_to_dict(xml_file: Path) -> Dict[str, float]:
        - root attribute `teleports`, or
        - `<teleports count="...">`, or
        - `<teleports>123</teleports>` textual content.
-    3) Extracts the latest `<step time="...">` attribute (as `step`).
+    3) Extracts the first `<step time="...">` attribute (as `step`).
+    4) Copies numeric attributes of the first `<vehicleTripStatistics>` and
+       `<performance>` elements (SUMO `--statistic-output`) as `<tag>_<attr>`.
+
+    The file is scanned with precompiled byte regexes (only the root and the
+    first of each element above are read); the ElementTree parser is used
+    only when no tag is found.
 
     Parameters
     ----------
@@ -130,38 +396,59 @@ def stats_xml_to_dict(xml_file: Path) -> Dict[str, float]:
     - Keys used:
         * `teleports_total` for the consolidated teleports count.
         * `step` for the last reported simulation time (if available).
+        * `vehicleTripStatistics_<attr>` (e.g. `_count`, `_waitingTime`,
+          `_duration`, `_speed`: means over finished trips) and
+          `performance_<attr>` (e.g. `_end`), when SUMO wrote them.
     """
-
-    def _is_number(s: str) -> bool:
-        try:
-            float(s)
-            return True
-        except (TypeError, ValueError):
-            return False
-
-    root = load_xml_root(path=xml_file)
-
-    # Numeric root attributes
-    attrs: Dict[str, float] = {k: float(v) for k, v in root.attrib.items() if _is_number(v)}
-
-    # Teleports (as root attribute)
-    if "teleports" in root.attrib and _is_number(root.attrib["teleports"]):
-        attrs["teleports_total"] = float(root.attrib["teleports"])
-
-    # Teleports (as sub-tag, by attribute or text)
-    tele = root.find(".//teleports")
-    if tele is not None:
-        if "count" in tele.attrib and _is_number(tele.attrib["count"]):
-            attrs["teleports_total"] = float(tele.attrib["count"])
-        elif tele.text and _is_number(tele.text.strip()):
-            attrs["teleports_total"] = float(tele.text.strip())
-
-    # Last step time (if present)
-    step = root.find(".//step")
-    if step is not None and _is_number(step.attrib.get("time", "0")):
-        attrs["step"] = float(step.attrib["time"])
-
-    return attrs
+    p = Path(xml_file)
+    is_gz = p.suffix == ".gz" or "".join(p.suffixes).endswith(".gz")
+    data = gzip.decompress(p.read_bytes()) if is_gz else p.read_bytes()
+    data = _RE_XML_COMMENT.sub(b"", data)
+
+    root = tele = step = None
+    sections: Dict[str, Dict[str, str]] = {}
+    wanted = {t.encode(): t for t in _STATS_SECTIONS}
+    for m in _RE_XML_TAG.finditer(data):
+        if root is None:
+            root = m
+            continue
+        tag = m.group(1)
+        if tele is None and tag == b"teleports":
+            tele = m
+        elif step is None and tag == b"step":
+            step = m
+        elif tag in wanted:
+            sections[wanted.pop(tag)] = _tag_attrs(m.group(2))
+        if tele is not None and step is not None and not wanted:
+            break
+
+    if root is None:  # nothing the scanner understands: full parse
+        xml_root = load_xml_root(path=xml_file)
+        tele_el, step_el = xml_root.find(".//teleports"), xml_root.find(".//step")
+        for t in _STATS_SECTIONS:
+            el = xml_root.find(f".//{t}")
+            if el is not None:
+                sections[t] = dict(el.attrib)
+        return _stats_from_parts(
+            dict(xml_root.attrib),
+            dict(tele_el.attrib) if tele_el is not None else None,
+            tele_el.text if tele_el is not None else None,
+            dict(step_el.attrib) if step_el is not None else None,
+            sections,
+        )
+
+    tele_text = None
+    if tele is not None and not tele.group(3):  # text up to the next tag
+        end = data.find(b"<", tele.end())
+        tele_text = data[tele.end(): end if end >= 0 else None].decode("utf-8", "replace")
+
+    return _stats_from_parts(
+        _tag_attrs(root.group(2)),
+        _tag_attrs(tele.group(2)) if tele is not None else None,
+        tele_text,
+        _tag_attrs(step.group(2)) if step is not None else None,
+        sections,
+    )
 
 
-__all__ = ["load_xml_root", "tripinfo_xml_to_df", "stats_xml_to_dict"]
+__all__ = ["load_xml_root", "iter_elements", "tripinfo_xml_to_arrays", "tripinfo_xml_to_df", "summarize_tripinfo", "stats_xml_to_dict"]
@@ -98,14 +98,21 @@ def _parse_run_folder_name(run_name: str) -> Tuple[str, str, str]:
       - 'gap' → 'gap_fuzzy' controller.
       - scenario heuristics for 'medium_extended' and 'very_high'.
 
+    Runs with green-bound overrides end in '_green<lmin>-<lmax>' (see
+    `run_experiment.run`); the suffix is appended to the controller
+    (e.g. 'fuzzy_green10-50') so they never pool with the configured runs.
+
     Args:
-        run_name: Folder name e.g. 'static_low_01'.
+        run_name: Folder name e.g. 'static_low_01' or 'fuzzy_low_01_green10-50'.
 
     Returns:
         Tuple(controller, scenario, seed) as strings.
     """
     parts = run_name.split("_")
+    green_tag = parts.pop() if len(parts) > 3 and parts[-1].startswith("green") else None
     controller = "gap_fuzzy" if (parts and parts[0] == "gap") else (parts[0] if parts else "unknown")
+    if green_tag is not None:
+        controller = f"{controller}_{green_tag}"
     seed = parts[-1] if parts else "0"
 
     # Scenario heuristics preserved from original logic
@@ -195,22 +202,26 @@ def parse_tripinfo(xml_path: Path) -> pd.DataFrame:
     Returns:
         DataFrame with columns ['arrival', 'waitingTime'] (float32).
     """
-    out: List[Dict[str, float]] = []
+    # Fixed two-column schema → flat per-column buffers, not one dict per trip.
+    arrivals: List[float] = []
+    waits: List[float] = []
     with xml_path.open("rb") as fh:
         for _, elem in ET.iterparse(fh, events=("end",)):
             if elem.tag != "tripinfo":
                 continue
             a = elem.attrib
-            arrival = float(a.get("arrival", a.get("arriveTime", "0") or 0))
-            waiting = float(a.get("waitingTime", a.get("waiting_time", "0") or 0))
-            out.append({"arrival": arrival, "waitingTime": waiting})
+            arrivals.append(float(a.get("arrival", a.get("arriveTime", "0") or 0)))
+            waits.append(float(a.get("waitingTime", a.get("waiting_time", "0") or 0)))
             elem.clear()
 
-    df = pd.DataFrame.from_records(out)
-    if not df.empty:
-        df["arrival"] = pd.to_numeric(df["arrival"], errors="coerce").astype("float32")
-        df["waitingTime"] = pd.to_numeric(df["waitingTime"], errors="coerce").astype("float32")
-    return df
+    if not arrivals:
+        return pd.DataFrame()
+    return pd.DataFrame(
+        {
+            "arrival": np.asarray(arrivals, dtype="float32"),
+            "waitingTime": np.asarray(waits, dtype="float32"),
+        }
+    )
 
 
 def load_all_tripinfo(exp_dir: Path | str = EXP_DIR, force_reload: bool = False) -> pd.DataFrame:
@@ -0,0 +1,60 @@
+# src/fuzzylts/utils/traci_backend.py
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Single switch for the TraCI implementation used across fuzzylts.
+
+The runner and every controller must talk to the **same** module: a session
+started through `traci` cannot be driven via `libsumo` and vice versa. All of
+them therefore import `traci` from here instead of importing it directly.
+
+Backends
+--------
+- `traci` (default): talks to a SUMO process over a TCP socket; one
+  round-trip per call. Required for `sumo-gui`.
+- `libsumo`: SUMO linked in-process (same API, no socket). Enabled with
+  `FUZZYLTS_USE_LIBSUMO=1`; falls back to `traci` with a warning when the
+  `libsumo` package is not installed.
+
+Usage
+-----
+    from fuzzylts.utils.traci_backend import traci, USING_LIBSUMO
+
+Notes
+-----
+- `traci.constants` is a plain constants module valid for both backends; keep
+  importing it as `import traci.constants as tc`.
+- libsumo cannot drive `sumo-gui`; the runner rejects that combination.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Final
+
+from fuzzylts.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# Environment switch (truthy values: 1/true/yes/on, case-insensitive)
+USE_LIBSUMO_ENV: Final[str] = "FUZZYLTS_USE_LIBSUMO"
+
+_requested = os.getenv(USE_LIBSUMO_ENV, "").strip().lower() in {"1", "true", "yes", "on"}
+
+if _requested:
+    try:
+        import libsumo as traci  # type: ignore[import-not-found]
+
+        USING_LIBSUMO: bool = True
+    except ImportError:
+        import traci  # type: ignore[no-redef]
+
+        USING_LIBSUMO = False
+        log.warning("%s is set but libsumo is not installed; using TraCI.", USE_LIBSUMO_ENV)
+else:
+    import traci  # type: ignore[no-redef]
+
+    USING_LIBSUMO = False
+
+
+__all__ = ["traci", "USING_LIBSUMO", "USE_LIBSUMO_ENV"]
@@ -0,0 +1,63 @@
+# tests/test_fuzzy_lut.py
+"""
+Regression tests: NumPy fuzzy inference vs scikit-fuzzy.
+
+`green_surface` re-implements `ControlSystemSimulation.compute()` and the fuzzy
+controller serves green times from a lookup table built with it. Both are
+checked here against scikit-fuzzy on a (vehicles × arrival-rate) grid that
+covers the whole universe plus out-of-range inputs (which are clipped).
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+os.environ.setdefault("TARGET_NET_XML", str(ROOT / "sumo_files" / "cuenca.net.xml.gz"))
+
+ctrl = pytest.importorskip("skfuzzy.control")
+fuzzy = pytest.importorskip("fuzzylts.controllers.fuzzy")
+from fuzzylts.utils.fuzzy_system import build_rules, green_surface  # noqa: E402
+
+# scikit-fuzzy's own np.maximum/np.minimum calls warn on recent NumPy
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning:skfuzzy.*")
+
+# Tolerances (seconds)
+SURFACE_ATOL = 1e-9  # same crisp inputs: float round-off only
+LUT_ATOL = 1         # rate snapped to the nearest LUT bin, then rounded
+
+# Vehicles past the universe and rates off the LUT bins (and above `lmax`)
+VEHICLES = list(range(fuzzy.SMALL_QUEUE_THRESHOLD + 1, int(fuzzy._veh_hi) + 3))
+RATES = np.linspace(0.0, 1.1, 23) + 3e-4
+
+
+@pytest.fixture(scope="module")
+def reference() -> np.ndarray:
+    """scikit-fuzzy output for every (vehicles, rate) grid point."""
+    v = fuzzy._vars
+    sim = ctrl.ControlSystemSimulation(
+        ctrl.ControlSystem(build_rules(fuzzy.cfg.rules, v["vehicles"], v["arrival"], v["green"]))
+    )
+    out = np.empty((len(VEHICLES), len(RATES)))
+    for i, n in enumerate(VEHICLES):
+        for j, r in enumerate(RATES):
+            sim.input["vehicles"] = float(n)
+            sim.input["arrival"] = float(r)
+            sim.compute()
+            out[i, j] = sim.output["green"]
+    return out
+
+
+def test_green_surface_matches_skfuzzy(reference: np.ndarray) -> None:
+    surface = green_surface(fuzzy._vars, fuzzy.cfg.rules, VEHICLES, RATES)
+    np.testing.assert_allclose(surface, reference, rtol=0, atol=SURFACE_ATOL)
+
+
+def test_green_lut_matches_skfuzzy(reference: np.ndarray) -> None:
+    expected = np.rint(np.clip(reference, fuzzy._green_lo, fuzzy._green_hi))
+    served = np.array([[fuzzy._compute_green(n, r) for r in RATES] for n in VEHICLES])
+    assert np.abs(served - expected).max() <= LUT_ATOL